@@ -20,184 +20,74 @@
 Detect installed Lisp validation tools and provide installation guidance.
 """
 
-import subprocess
 import sys
 import json
 import platform
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 
-# Import shared constants
+# Tool detection lives in the shared registry; re-exported here for callers
+# that import it from check_tools
 try:
-    from validation_types import TOOL_CHECK_TIMEOUT_SECONDS
+    from tool_registry import check_command, check_tools, get_platform_install_cmd, get_tool_status
 except ImportError:
     # Handle when running as script
     import importlib.util
     script_dir = Path(__file__).parent
-    spec = importlib.util.spec_from_file_location("validation_types", script_dir / "validation_types.py")
+    spec = importlib.util.spec_from_file_location("tool_registry", script_dir / "tool_registry.py")
     module = importlib.util.module_from_spec(spec)
     spec.loader.exec_module(module)
-    TOOL_CHECK_TIMEOUT_SECONDS = module.TOOL_CHECK_TIMEOUT_SECONDS
+    check_command = module.check_command
+    check_tools = module.check_tools
+    get_platform_install_cmd = module.get_platform_install_cmd
+    get_tool_status = module.get_tool_status
 
-
-def check_command(command: str, args: List[str] = ["--version"]) -> Tuple[bool, Optional[str]]:
-    """
-    Check if a command is available.
-
-    Args:
-        command: Command name to check
-        args: Arguments to test command
-
-    Returns:
-        Tuple of (available, version_info)
-    """
-    try:
-        result = subprocess.run(
-            [command] + args,
-            capture_output=True,
-            text=True,
-            timeout=TOOL_CHECK_TIMEOUT_SECONDS
-        )
-        return True, result.stdout.strip()
-    except FileNotFoundError:
-        return False, None
-    except subprocess.TimeoutExpired:
-        return True, "available (version check timed out)"
-    except Exception:
-        return False, None
-
-
-def get_platform_install_cmd(tool: str) -> Dict[str, str]:
-    """
-    Get platform-specific installation commands.
-
-    Args:
-        tool: Tool name
-
-    Returns:
-        Dict of platform -> install command
-    """
-    install_commands = {
-        "clj-kondo": {
-            "darwin": "brew install borkdude/brew/clj-kondo",
-            "linux": "curl -sLO https://raw.githubusercontent.com/borkdude/clj-kondo/master/script/install-clj-kondo && chmod +x install-clj-kondo && ./install-clj-kondo",
-            "windows": "npm install -g clj-kondo",
-            "universal": "npm install -g clj-kondo"
-        },
-        "joker": {
-            "darwin": "brew install candid82/joker/joker",
-            "linux": "Download from: https://github.com/candid82/joker/releases",
-            "windows": "Download from: https://github.com/candid82/joker/releases",
-            "universal": "Download binary from: https://github.com/candid82/joker/releases"
-        },
-        "raco": {
-            "darwin": "brew install racket",
-            "linux": "apt install racket (Ubuntu/Debian) or download from: https://racket-lang.org",
-            "windows": "Download installer from: https://racket-lang.org",
-            "universal": "Install Racket from: https://racket-lang.org"
-        },
-        "sblint": {
-            "universal": "ros install sbcl && ros use sbcl && ros install cxxxr/sblint"
-        },
-        "sbcl": {
-            "darwin": "brew install sbcl or ros install sbcl",
-            "linux": "apt install sbcl (Ubuntu/Debian) or ros install sbcl",
-            "windows": "Download from: http://www.sbcl.org or use Roswell",
-            "universal": "ros install sbcl or download from: http://www.sbcl.org"
-        },
-        "tree-sitter": {
-            "universal": "npm install -g tree-sitter-cli@0.19.3"
-        },
-        "tree-sitter-python": {
-            "universal": "pip install tree-sitter tree-sitter-commonlisp tree-sitter-clojure tree-sitter-elisp"
-        }
-    }
-
-    return install_commands.get(tool, {})
-
-
-def check_tools() -> Dict[str, Dict]:
+# Optional faster JSON encoder for compact output
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# The host platform cannot change while the process is running
+_PLATFORM = platform.system().lower()
+
+# Recommendation groups, in output order
+_RECOMMENDATION_DIALECTS = ["clojure", "racket", "scheme", "common-lisp", "elisp", "universal"]
+
+# (dialect, tool, message) - the message is shown when the tool is missing
+_RECOMMENDATION_RULES = [
+    ("clojure", "clj-kondo", "⚠️  Install clj-kondo (primary Clojure validator)"),
+    ("clojure", "joker", "ℹ️  Consider installing joker (complementary checks)"),
+    ("racket", "raco", "⚠️  Install Racket (provides raco tools)"),
+    ("scheme", "raco", "ℹ️  Install Racket for raco tools (works with generic Scheme)"),
+    ("common-lisp", "sblint", "⚠️  Install sblint (primary Common Lisp linter)"),
+    ("common-lisp", "sbcl", "ℹ️  Consider installing SBCL (deep validation)"),
+]
+
+# Text output groups tools under these headings, in this order
+_DISPLAY_BUCKETS = ["clojure", "racket/scheme", "common-lisp", "universal"]
+
+# Tool dialect tag -> display heading
+_DIALECT_BUCKETS = {
+    "clojure": "clojure",
+    "racket": "racket/scheme",
+    "scheme": "racket/scheme",
+    "common-lisp": "common-lisp",
+    "all": "universal"
+}
+
+
+@lru_cache(maxsize=None)
+def _display_buckets(dialects: Tuple[str, ...]) -> Tuple[str, ...]:
     """
-    Check all Lisp validation tools.
+    Resolve a tool's dialect tags to its display headings.
 
-    Returns:
-        Dict of tool statuses and recommendations
+    Tools mostly share a handful of tag lists, so this is memoized per list.
+    Order follows the tags and repeats are dropped, so a tool tagged both
+    racket and scheme is listed once.
     """
-    tools = {
-        "clj-kondo": {
-            "check_cmd": ["clj-kondo", "--version"],
-            "description": "Primary Clojure validator with JSON output",
-            "dialects": ["clojure"],
-            "priority": "high"
-        },
-        "joker": {
-            "check_cmd": ["joker", "--version"],
-            "description": "Secondary Clojure validator with complementary checks",
-            "dialects": ["clojure"],
-            "priority": "medium"
-        },
-        "raco": {
-            "check_cmd": ["raco", "version"],
-            "description": "Racket/Scheme validation tools (expand, review, warn)",
-            "dialects": ["racket", "scheme"],
-            "priority": "high"
-        },
-        "sblint": {
-            "check_cmd": ["sblint", "--version"],
-            "description": "Primary Common Lisp linter with machine-readable output",
-            "dialects": ["common-lisp"],
-            "priority": "high"
-        },
-        "sbcl": {
-            "check_cmd": ["sbcl", "--version"],
-            "description": "Common Lisp compiler for deep semantic validation",
-            "dialects": ["common-lisp"],
-            "priority": "medium"
-        },
-        "tree-sitter": {
-            "check_cmd": ["tree-sitter", "--version"],
-            "description": "Universal parser for incomplete/partial code (CLI)",
-            "dialects": ["all"],
-            "priority": "high"
-        }
-    }
-
-    result = {}
-
-    for tool, info in tools.items():
-        available, version = check_command(info["check_cmd"][0], info["check_cmd"][1:])
-
-        result[tool] = {
-            "available": available,
-            "version": version,
-            "description": info["description"],
-            "dialects": info["dialects"],
-            "priority": info["priority"],
-            "install": get_platform_install_cmd(tool)
-        }
-
-    # Check Python tree-sitter library separately
-    try:
-        import tree_sitter
-        result["tree-sitter-python"] = {
-            "available": True,
-            "version": tree_sitter.__version__ if hasattr(tree_sitter, '__version__') else "installed",
-            "description": "Tree-sitter Python library (more reliable than CLI)",
-            "dialects": ["all"],
-            "priority": "high",
-            "install": get_platform_install_cmd("tree-sitter-python")
-        }
-    except ImportError:
-        result["tree-sitter-python"] = {
-            "available": False,
-            "version": None,
-            "description": "Tree-sitter Python library (more reliable than CLI)",
-            "dialects": ["all"],
-            "priority": "high",
-            "install": get_platform_install_cmd("tree-sitter-python")
-        }
-
-    return result
+    return tuple(dict.fromkeys(_DIALECT_BUCKETS[d] for d in dialects if d in _DIALECT_BUCKETS))
 
 
 def generate_recommendations(tools: Dict[str, Dict]) -> Dict[str, List[str]]:
@@ -210,42 +100,27 @@ def generate_recommendations(tools: Dict[str, Dict]) -> Dict[str, List[str]]:
     Returns:
         Dict of dialect -> list of recommendations
     """
-    recommendations = {
-        "clojure": [],
-        "racket": [],
-        "scheme": [],
-        "common-lisp": [],
-        "elisp": [],
-        "universal": []
-    }
-
-    # Clojure
-    if not tools["clj-kondo"]["available"]:
-        recommendations["clojure"].append("⚠️  Install clj-kondo (primary Clojure validator)")
-    if not tools["joker"]["available"]:
-        recommendations["clojure"].append("ℹ️  Consider installing joker (complementary checks)")
-
-    # Racket/Scheme
-    if not tools["raco"]["available"]:
-        recommendations["racket"].append("⚠️  Install Racket (provides raco tools)")
-        recommendations["scheme"].append("ℹ️  Install Racket for raco tools (works with generic Scheme)")
-
-    # Common Lisp
-    if not tools["sblint"]["available"]:
-        recommendations["common-lisp"].append("⚠️  Install sblint (primary Common Lisp linter)")
-    if not tools["sbcl"]["available"]:
-        recommendations["common-lisp"].append("ℹ️  Consider installing SBCL (deep validation)")
-
-    # Universal
-    if not tools["tree-sitter"]["available"] and not tools.get("tree-sitter-python", {}).get("available"):
-        recommendations["universal"].append("⚠️  Install tree-sitter (critical for incomplete code)")
-    elif tools["tree-sitter"]["available"] and not tools.get("tree-sitter-python", {}).get("available"):
-        recommendations["universal"].append("ℹ️  Consider tree-sitter Python library (more reliable)")
+    recommendations = {dialect: [] for dialect in _RECOMMENDATION_DIALECTS}
+
+    def available(tool: str) -> bool:
+        return tools.get(tool, {}).get("available", False)
+
+    for dialect, tool, message in _RECOMMENDATION_RULES:
+        if not available(tool):
+            recommendations[dialect].append(message)
+
+    # Universal: either tree-sitter flavour covers incomplete code
+    if not available("tree-sitter-python"):
+        if available("tree-sitter"):
+            recommendations["universal"].append("ℹ️  Consider tree-sitter Python library (more reliable)")
+        else:
+            recommendations["universal"].append("⚠️  Install tree-sitter (critical for incomplete code)")
 
     return recommendations
 
 
-def format_output(tools: Dict[str, Dict], recommendations: Dict[str, List[str]], output_format: str = "text") -> str:
+def format_output(tools: Dict[str, Dict], recommendations: Dict[str, List[str]],
+                  output_format: str = "text", indent: Optional[int] = 2) -> str:
     """
     Format tool check results.
 
@@ -253,44 +128,44 @@ def format_output(tools: Dict[str, Dict], recommendations: Dict[str, List[str]],
         tools: Tool status dict
         recommendations: Recommendations dict
         output_format: Output format (text|json)
+        indent: JSON indentation, or None for compact single-line JSON
 
     Returns:
         Formatted string
     """
     if output_format == "json":
-        return json.dumps({
+        data = {
             "tools": tools,
             "recommendations": recommendations,
-            "platform": platform.system().lower()
-        }, indent=2)
+            "platform": _PLATFORM
+        }
+        if indent is not None:
+            return json.dumps(data, indent=indent)
+        if orjson is not None:
+            return orjson.dumps(data).decode("utf-8")
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
 
     # Text format
     lines = []
     lines.append("=== Lisp Validation Tools Status ===\n")
 
-    # Group by dialect
-    for dialect in ["clojure", "racket/scheme", "common-lisp", "universal"]:
-        lines.append(f"{dialect.upper()}:")
+    # Group by dialect in a single pass over the tools
+    buckets = {bucket: [] for bucket in _DISPLAY_BUCKETS}
+
+    for tool, info in tools.items():
+        version = info["version"]
+        status = "✓" if info["available"] else "✗"
+        version_suffix = f" ({version})" if version else ""
+        entry = [f"  [{status}] {tool}{version_suffix}", f"      {info['description']}"]
+        if info.get("warning"):
+            entry.append(f"      ⚠️  {info['warning']}")
 
-        for tool, info in tools.items():
-            if dialect == "universal" and "all" in info["dialects"]:
-                status = "✓" if info["available"] else "✗"
-                version = f" ({info['version']})" if info["version"] else ""
-                lines.append(f"  [{status}] {tool}{version}")
-                lines.append(f"      {info['description']}")
-
-            elif dialect == "racket/scheme" and any(d in info["dialects"] for d in ["racket", "scheme"]):
-                status = "✓" if info["available"] else "✗"
-                version = f" ({info['version']})" if info["version"] else ""
-                lines.append(f"  [{status}] {tool}{version}")
-                lines.append(f"      {info['description']}")
-
-            elif dialect in info["dialects"]:
-                status = "✓" if info["available"] else "✗"
-                version = f" ({info['version']})" if info["version"] else ""
-                lines.append(f"  [{status}] {tool}{version}")
-                lines.append(f"      {info['description']}")
+        for bucket in _display_buckets(tuple(info["dialects"])):
+            buckets[bucket].extend(entry)
 
+    for dialect, entries in buckets.items():
+        lines.append(f"{dialect.upper()}:")
+        lines.extend(entries)
         lines.append("")
 
     # Show recommendations
@@ -299,40 +174,38 @@ def format_output(tools: Dict[str, Dict], recommendations: Dict[str, List[str]],
     for dialect, recs in recommendations.items():
         if recs:
             lines.append(f"{dialect.upper()}:")
-            for rec in recs:
-                lines.append(f"  {rec}")
+            lines.extend(f"  {rec}" for rec in recs)
             lines.append("")
 
     # Show installation instructions for missing high-priority tools
     lines.append("=== Installation Instructions ===\n")
-    current_platform = platform.system().lower()
 
     for tool, info in tools.items():
-        if not info["available"] and info["priority"] == "high":
-            lines.append(f"{tool}:")
+        if info["available"] or info["priority"] != "high":
+            continue
 
-            install_cmds = info["install"]
-            if current_platform in install_cmds:
-                lines.append(f"  {install_cmds[current_platform]}")
-            elif "universal" in install_cmds:
-                lines.append(f"  {install_cmds['universal']}")
+        lines.append(f"{tool}:")
 
-            lines.append("")
+        install_cmds = info["install"]
+        install_cmd = install_cmds.get(_PLATFORM) or install_cmds.get("universal")
+        if install_cmd:
+            lines.append(f"  {install_cmd}")
+
+        lines.append("")
 
     return "\n".join(lines)
 
 
 def main():
     """CLI entry point."""
-    output_format = "text"
-
-    if len(sys.argv) > 1 and sys.argv[1] == "--json":
-        output_format = "json"
+    output_format = "json" if "--json" in sys.argv[1:] else "text"
+    indent = None if "--compact" in sys.argv[1:] else 2
+    refresh = "--refresh" in sys.argv[1:]
 
-    tools = check_tools()
+    tools = check_tools(refresh=True) if refresh else get_tool_status()
     recommendations = generate_recommendations(tools)
 
-    print(format_output(tools, recommendations, output_format))
+    print(format_output(tools, recommendations, output_format, indent=indent))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+#
+# Lisp Validator - Multi-dialect Lisp code validation tool
+# Copyright (C) 2025  Tom Waddington
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Content-addressed cache of single-file validation results.
+
+Results are keyed by a hash of the file's bytes together with its path,
+the validator options, any tool configuration files and the tools
+involved (resolved binary, its mtime and size, and version), so editing
+the file or its linter config, changing options or upgrading a tool all
+miss the cache. Files the code itself loads are not tracked, which is why
+the validators only use this cache when asked to.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Any, Optional, Sequence
+
+# Import shared helpers
+try:
+    from validation_types import get_cache_dir
+    from tool_registry import find_tool, get_tool_version
+except ImportError:
+    # Handle when running as script
+    import importlib.util
+    script_dir = Path(__file__).parent
+    spec = importlib.util.spec_from_file_location("validation_types", script_dir / "validation_types.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    get_cache_dir = module.get_cache_dir
+
+    spec = importlib.util.spec_from_file_location("tool_registry", script_dir / "tool_registry.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    find_tool = module.find_tool
+    get_tool_version = module.get_tool_version
+
+# Cached results live in this subdirectory of get_cache_dir()
+RESULT_CACHE_SUBDIR = "results"
+
+
+def _tool_identity(tool: str) -> Optional[Dict[str, Any]]:
+    """
+    Identify the installed copy of a tool for the cache key.
+
+    The binary's mtime and size catch an in-place upgrade even when the
+    PATH directories (and so the cached version probe) look unchanged.
+
+    Args:
+        tool: Tool name
+
+    Returns:
+        Dict of resolved path, mtime, size and version, or None if the tool
+        is not installed
+    """
+    path = find_tool(tool)
+    if path is None:
+        return None
+
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+
+    return {
+        "path": os.path.realpath(path),
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "version": get_tool_version(tool)
+    }
+
+
+def _file_digest(path: str) -> Optional[str]:
+    """Hash a file's contents, or None if it doesn't exist or can't be read."""
+    try:
+        with open(path, "rb") as f:
+            return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+    except OSError:
+        return None
+
+
+def result_cache_key(target: str, options: Dict[str, Any], tools: Sequence[str],
+                     config_files: Sequence[str] = ()) -> Optional[str]:
+    """
+    Compute the cache key for validating a single file.
+
+    Args:
+        target: File path, as given by the caller
+        options: Validator options that affect the result
+        tools: Tools whose installed copy affects the result
+        config_files: Tool configuration files that affect the result; a
+            missing file is keyed as missing, so creating it misses too
+
+    Returns:
+        Hex digest, or None if the file cannot be read
+    """
+    try:
+        with open(target, "rb") as f:
+            content = f.read()
+    except OSError:
+        return None
+
+    # Findings echo the path as given, so key on it as well as the real path
+    context = {
+        "target": target,
+        "path": os.path.realpath(target),
+        "options": options,
+        "tools": {tool: _tool_identity(tool) for tool in tools},
+        "config": {os.path.realpath(path): _file_digest(path) for path in config_files}
+    }
+
+    digest = hashlib.blake2b(content, digest_size=16)
+    digest.update(json.dumps(context, sort_keys=True).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def load_cached_result(key: str) -> Optional[Dict[str, Any]]:
+    """
+    Load a cached validation result.
+
+    Args:
+        key: Cache key from result_cache_key()
+
+    Returns:
+        The cached result, or None on a miss
+    """
+    try:
+        with open(get_cache_dir() / RESULT_CACHE_SUBDIR / f"{key}.json", "r", encoding="utf-8") as f:
+            result = json.load(f)
+    except (OSError, ValueError):
+        # Missing, unreadable or malformed entry: treat as a miss
+        return None
+
+    return result if isinstance(result, dict) else None
+
+
+def store_cached_result(key: str, result: Dict[str, Any]) -> None:
+    """
+    Cache a validation result (best effort).
+
+    Results carrying tool warnings (a tool missing, timing out or failing)
+    are not stored, since a later run may well succeed.
+
+    Args:
+        key: Cache key from result_cache_key()
+        result: Validation result
+    """
+    if result.get("warnings"):
+        return
+
+    cache_file = get_cache_dir() / RESULT_CACHE_SUBDIR / f"{key}.json"
+
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(result, f)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
@@ -0,0 +1,422 @@
+#!/usr/bin/env python3
+#
+# Lisp Validator - Multi-dialect Lisp code validation tool
+# Copyright (C) 2025  Tom Waddington
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Shared registry of Lisp validation tools.
+
+Probes each tool once per process (and caches results on disk between
+runs) so check_tools.py and the validators share one view of what is
+installed.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Tuple, Optional, Sequence
+
+# Import shared constants
+try:
+    from validation_types import TOOL_CHECK_TIMEOUT_SECONDS, get_cache_dir
+except ImportError:
+    # Handle when running as script
+    import importlib.util
+    script_dir = Path(__file__).parent
+    spec = importlib.util.spec_from_file_location("validation_types", script_dir / "validation_types.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    TOOL_CHECK_TIMEOUT_SECONDS = module.TOOL_CHECK_TIMEOUT_SECONDS
+    get_cache_dir = module.get_cache_dir
+
+# Probe results persist here between runs, keyed by a $PATH fingerprint
+TOOL_CACHE_FILENAME = "tools.json"
+
+# Command-line tools and how to probe them, in display order
+TOOLS = {
+    "clj-kondo": {
+        "check_cmd": ["clj-kondo", "--version"],
+        "description": "Primary Clojure validator with JSON output",
+        "dialects": ["clojure"],
+        "priority": "high"
+    },
+    "joker": {
+        "check_cmd": ["joker", "--version"],
+        "description": "Secondary Clojure validator with complementary checks",
+        "dialects": ["clojure"],
+        "priority": "medium"
+    },
+    "raco": {
+        "check_cmd": ["raco", "version"],
+        "description": "Racket/Scheme validation tools (expand, review, warn)",
+        "dialects": ["racket", "scheme"],
+        "priority": "high"
+    },
+    "sblint": {
+        "check_cmd": ["sblint", "--version"],
+        "description": "Primary Common Lisp linter with machine-readable output",
+        "dialects": ["common-lisp"],
+        "priority": "high"
+    },
+    "sbcl": {
+        "check_cmd": ["sbcl", "--version"],
+        "description": "Common Lisp compiler for deep semantic validation",
+        "dialects": ["common-lisp"],
+        "priority": "medium"
+    },
+    "tree-sitter": {
+        "check_cmd": ["tree-sitter", "--version"],
+        "description": "Universal parser for incomplete/partial code (CLI)",
+        "dialects": ["all"],
+        "priority": "high"
+    }
+}
+
+
+def check_command(command: str, args: Sequence[str] = ("--version",),
+                  want_version: bool = True) -> Tuple[bool, Optional[str]]:
+    """
+    Check if a command is available.
+
+    Presence is decided by a PATH lookup, so missing tools never cost a
+    process spawn. Results are cached for the lifetime of the process.
+
+    Args:
+        command: Command name to check
+        args: Arguments to test command
+        want_version: Run the command with args to capture its version string
+
+    Returns:
+        Tuple of (available, version_info)
+    """
+    available, version, _ = _check_command_cached(command, tuple(args), want_version)
+    return available, version
+
+
+@lru_cache(maxsize=None)
+def _check_command_cached(command: str, args: Tuple[str, ...],
+                          want_version: bool) -> Tuple[bool, Optional[str], bool]:
+    """
+    Run the availability probe for check_command (hashable arguments only).
+
+    Returns:
+        Tuple of (available, version_info, timed_out)
+    """
+    if shutil.which(command) is None:
+        return False, None, False
+
+    if not want_version:
+        return True, None, False
+
+    try:
+        result = subprocess.run(
+            [command, *args],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            errors="replace",
+            timeout=TOOL_CHECK_TIMEOUT_SECONDS
+        )
+        return True, result.stdout.strip(), False
+    except FileNotFoundError:
+        return False, None, False
+    except subprocess.TimeoutExpired:
+        # The binary is on PATH but slow to answer (a cold JVM, say): it is
+        # installed, we just don't know its version
+        return True, None, True
+    except Exception:
+        return False, None, False
+
+
+@lru_cache(maxsize=None)
+def find_tool(tool: str) -> Optional[str]:
+    """
+    Resolve a tool on PATH, without spawning it.
+
+    Args:
+        tool: Executable name
+
+    Returns:
+        Path to the executable, or None if it is not on PATH
+    """
+    return shutil.which(tool)
+
+
+def is_tool_available(tool: str) -> bool:
+    """
+    Check whether a tool is on PATH, without spawning it.
+
+    Validators call this before running a tool so a missing binary costs
+    one cached PATH lookup per process instead of a failed exec per run.
+
+    Args:
+        tool: Executable name
+
+    Returns:
+        True if the executable can be found on PATH
+    """
+    return find_tool(tool) is not None
+
+
+@lru_cache(maxsize=None)
+def get_platform_install_cmd(tool: str) -> Dict[str, str]:
+    """
+    Get platform-specific installation commands.
+
+    Args:
+        tool: Tool name
+
+    Returns:
+        Dict of platform -> install command
+    """
+    install_commands = {
+        "clj-kondo": {
+            "darwin": "brew install borkdude/brew/clj-kondo",
+            "linux": "curl -sLO https://raw.githubusercontent.com/borkdude/clj-kondo/master/script/install-clj-kondo && chmod +x install-clj-kondo && ./install-clj-kondo",
+            "windows": "npm install -g clj-kondo",
+            "universal": "npm install -g clj-kondo"
+        },
+        "joker": {
+            "darwin": "brew install candid82/joker/joker",
+            "linux": "Download from: https://github.com/candid82/joker/releases",
+            "windows": "Download from: https://github.com/candid82/joker/releases",
+            "universal": "Download binary from: https://github.com/candid82/joker/releases"
+        },
+        "raco": {
+            "darwin": "brew install racket",
+            "linux": "apt install racket (Ubuntu/Debian) or download from: https://racket-lang.org",
+            "windows": "Download installer from: https://racket-lang.org",
+            "universal": "Install Racket from: https://racket-lang.org"
+        },
+        "sblint": {
+            "universal": "ros install sbcl && ros use sbcl && ros install cxxxr/sblint"
+        },
+        "sbcl": {
+            "darwin": "brew install sbcl or ros install sbcl",
+            "linux": "apt install sbcl (Ubuntu/Debian) or ros install sbcl",
+            "windows": "Download from: http://www.sbcl.org or use Roswell",
+            "universal": "ros install sbcl or download from: http://www.sbcl.org"
+        },
+        "tree-sitter": {
+            "universal": "npm install -g tree-sitter-cli@0.19.3"
+        },
+        "tree-sitter-python": {
+            "universal": "pip install tree-sitter tree-sitter-commonlisp tree-sitter-clojure tree-sitter-elisp"
+        }
+    }
+
+    return install_commands.get(tool, {})
+
+
+def path_fingerprint() -> str:
+    """
+    Fingerprint $PATH for the probe cache.
+
+    Installing or removing a tool changes the modification time of the
+    directory holding it, so hashing each PATH directory with its mtime
+    detects when cached probe results may be stale.
+
+    Returns:
+        Hex digest of the PATH directories and their mtimes
+    """
+    digest = hashlib.blake2b(digest_size=16)
+
+    for directory in os.environ.get("PATH", "").split(os.pathsep):
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except OSError:
+            continue
+        digest.update(f"{directory}\0{mtime_ns}\0".encode("utf-8", "surrogateescape"))
+
+    return digest.hexdigest()
+
+
+def _load_cached_probes(fingerprint: str) -> Dict[str, Tuple[bool, Optional[str], bool]]:
+    """
+    Return the probe results cached for this fingerprint.
+
+    A cached "not installed" is dropped when the tool is now on PATH, in case
+    an earlier run's probe failed for some transient reason.
+    """
+    try:
+        with open(get_cache_dir() / TOOL_CACHE_FILENAME, "r", encoding="utf-8") as f:
+            probes = json.load(f).get(fingerprint) or {}
+
+        return {
+            tool: (bool(available), version, False)
+            for tool, (available, version) in probes.items()
+            if available or shutil.which(TOOLS.get(tool, {}).get("check_cmd", [tool])[0]) is None
+        }
+    except (OSError, ValueError, TypeError, AttributeError):
+        # Missing, unreadable or malformed cache: treat as a miss
+        return {}
+
+
+def _store_cached_probes(fingerprint: str, probes: Dict[str, Tuple[bool, Optional[str]]]) -> None:
+    """Persist probe results for this fingerprint (best effort)."""
+    cache_file = get_cache_dir() / TOOL_CACHE_FILENAME
+
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump({fingerprint: probes}, f)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+
+
+def check_tools(refresh: bool = False) -> Dict[str, Dict]:
+    """
+    Check all Lisp validation tools.
+
+    Probe results are cached on disk (see get_cache_dir) and reused while
+    the $PATH fingerprint is unchanged. Timed-out probes are not cached, and
+    a cached negative is re-probed once the tool is found on PATH.
+
+    Args:
+        refresh: Ignore cached probe results and re-run every probe
+
+    Returns:
+        Dict of tool statuses and recommendations
+    """
+    tools = TOOLS
+    result = {}
+
+    fingerprint = path_fingerprint()
+
+    if refresh:
+        _check_command_cached.cache_clear()
+        probes = {}
+    else:
+        probes = _load_cached_probes(fingerprint)
+
+    unprobed = [tool for tool in tools if tool not in probes]
+
+    if unprobed:
+        # Probes are independent and I/O-bound, so run them concurrently
+        with ThreadPoolExecutor(max_workers=len(unprobed)) as executor:
+            futures = {
+                tool: executor.submit(_check_command_cached, tools[tool]["check_cmd"][0],
+                                      tuple(tools[tool]["check_cmd"][1:]), True)
+                for tool in unprobed
+            }
+        probes.update((tool, future.result()) for tool, future in futures.items())
+
+        # A timed-out probe says nothing definite, so it is retried next run
+        # rather than cached
+        _store_cached_probes(fingerprint, {
+            tool: (available, version)
+            for tool, (available, version, timed_out) in probes.items()
+            if not timed_out
+        })
+
+    # Assemble in definition order so output stays deterministic
+    for tool, info in tools.items():
+        available, version, timed_out = probes[tool]
+
+        result[tool] = {
+            "available": available,
+            "version": version,
+            "description": info["description"],
+            "dialects": info["dialects"],
+            "priority": info["priority"],
+            "install": get_platform_install_cmd(tool)
+        }
+
+        # Reported to the caller rather than printed, so it shows up wherever
+        # the status is displayed
+        if timed_out:
+            result[tool]["warning"] = (
+                f"{info['check_cmd'][0]} did not answer {' '.join(info['check_cmd'][1:])} "
+                f"within {TOOL_CHECK_TIMEOUT_SECONDS}s, version unknown"
+            )
+
+    # Check Python tree-sitter library separately
+    try:
+        import tree_sitter
+        result["tree-sitter-python"] = {
+            "available": True,
+            "version": tree_sitter.__version__ if hasattr(tree_sitter, '__version__') else "installed",
+            "description": "Tree-sitter Python library (more reliable than CLI)",
+            "dialects": ["all"],
+            "priority": "high",
+            "install": get_platform_install_cmd("tree-sitter-python")
+        }
+    except ImportError:
+        result["tree-sitter-python"] = {
+            "available": False,
+            "version": None,
+            "description": "Tree-sitter Python library (more reliable than CLI)",
+            "dialects": ["all"],
+            "priority": "high",
+            "install": get_platform_install_cmd("tree-sitter-python")
+        }
+
+    return result
+
+
+@lru_cache(maxsize=1)
+def get_tool_status() -> Dict[str, Dict]:
+    """
+    Get tool statuses for this process.
+
+    Runs check_tools() on first call and returns the same result afterwards,
+    so every caller in a long-lived process shares a single probe set.
+
+    Returns:
+        Dict of tool statuses (see check_tools)
+    """
+    return check_tools()
+
+
+@lru_cache(maxsize=None)
+def get_tool_version(tool: str) -> Optional[str]:
+    """
+    Get one tool's version string.
+
+    Only this tool is probed, sharing the on-disk probe cache with
+    check_tools(), so a validator asking about its own tools doesn't pay
+    for probing every registered tool.
+
+    Args:
+        tool: Tool name (a key of TOOLS)
+
+    Returns:
+        Version string, or None if the tool is unknown, not installed or
+        did not report a version
+    """
+    if tool not in TOOLS or not is_tool_available(tool):
+        return None
+
+    fingerprint = path_fingerprint()
+    probes = _load_cached_probes(fingerprint)
+
+    if tool not in probes:
+        check_cmd = TOOLS[tool]["check_cmd"]
+        probe = _check_command_cached(check_cmd[0], tuple(check_cmd[1:]), True)
+        if probe[2]:
+            # Timed out: nothing definite to cache
+            return None
+        probes[tool] = probe
+        _store_cached_probes(fingerprint, {name: (available, version) for name, (available, version, _) in probes.items()})
+
+    return probes[tool][1]
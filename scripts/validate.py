@@ -21,70 +21,117 @@ Main orchestrator for Lisp validation across all dialects.
 Auto-detects dialect and routes to appropriate validators.
 """
 
-import json
+import argparse
+import functools
+import importlib
+import importlib.util
+import os
+import stat
 import sys
 import re
+from collections import deque
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Callable, Iterator, List, Optional, Union
 
-# Import shared types and constants
-try:
-    from validation_types import (
-        ValidationResult, Finding, ValidationSummary,
-        DIALECT_DETECTION_BYTES, EXIT_SUCCESS, EXIT_WARNINGS, EXIT_ERRORS,
-        DIALECT_CLOJURE, DIALECT_RACKET, DIALECT_SCHEME,
-        DIALECT_COMMON_LISP, DIALECT_ELISP, DIALECT_UNKNOWN
-    )
-except ImportError:
-    # Handle when running as script
-    import importlib.util
-    script_dir = Path(__file__).parent
-    spec = importlib.util.spec_from_file_location("validation_types", script_dir / "validation_types.py")
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-
-    ValidationResult = module.ValidationResult
-    Finding = module.Finding
-    ValidationSummary = module.ValidationSummary
-    DIALECT_DETECTION_BYTES = module.DIALECT_DETECTION_BYTES
-    EXIT_SUCCESS = module.EXIT_SUCCESS
-    EXIT_WARNINGS = module.EXIT_WARNINGS
-    EXIT_ERRORS = module.EXIT_ERRORS
-    DIALECT_CLOJURE = module.DIALECT_CLOJURE
-    DIALECT_RACKET = module.DIALECT_RACKET
-    DIALECT_SCHEME = module.DIALECT_SCHEME
-    DIALECT_COMMON_LISP = module.DIALECT_COMMON_LISP
-    DIALECT_ELISP = module.DIALECT_ELISP
-    DIALECT_UNKNOWN = module.DIALECT_UNKNOWN
-
-# Import dialect-specific validators
-try:
-    from validate_clojure import validate_clojure
-    from validate_scheme import validate_scheme
-    from validate_common_lisp import validate_common_lisp
-    from validate_tree_sitter import validate_tree_sitter
-except ImportError:
-    # Handle when running as script
-    import importlib.util
-    import os
-
-    script_dir = Path(__file__).parent
-
-    def load_module(name, path):
-        spec = importlib.util.spec_from_file_location(name, path)
+
+def _load(name: str):
+    """
+    Import a sibling script module by name.
+
+    Falls back to loading it from this file's directory when the scripts
+    directory is not on sys.path (e.g. when loaded through importlib).
+
+    Args:
+        name: Module name (file name without .py)
+
+    Returns:
+        Loaded module
+    """
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        spec = importlib.util.spec_from_file_location(name, Path(__file__).parent / f"{name}.py")
         module = importlib.util.module_from_spec(spec)
         spec.loader.exec_module(module)
         return module
 
-    clojure_mod = load_module("validate_clojure", script_dir / "validate_clojure.py")
-    scheme_mod = load_module("validate_scheme", script_dir / "validate_scheme.py")
-    commonlisp_mod = load_module("validate_common_lisp", script_dir / "validate_common_lisp.py")
-    treesitter_mod = load_module("validate_tree_sitter", script_dir / "validate_tree_sitter.py")
 
-    validate_clojure = clojure_mod.validate_clojure
-    validate_scheme = scheme_mod.validate_scheme
-    validate_common_lisp = commonlisp_mod.validate_common_lisp
-    validate_tree_sitter = treesitter_mod.validate_tree_sitter
+# Import shared types and constants
+_types = _load("validation_types")
+
+DIALECT_DETECTION_BYTES = _types.DIALECT_DETECTION_BYTES
+EXIT_SUCCESS = _types.EXIT_SUCCESS
+EXIT_WARNINGS = _types.EXIT_WARNINGS
+EXIT_ERRORS = _types.EXIT_ERRORS
+DIALECT_CLOJURE = _types.DIALECT_CLOJURE
+DIALECT_RACKET = _types.DIALECT_RACKET
+DIALECT_SCHEME = _types.DIALECT_SCHEME
+DIALECT_COMMON_LISP = _types.DIALECT_COMMON_LISP
+DIALECT_ELISP = _types.DIALECT_ELISP
+DIALECT_UNKNOWN = _types.DIALECT_UNKNOWN
+dumps_json = _types.dumps_json
+
+
+@functools.lru_cache(maxsize=None)
+def _load_validator(name: str) -> Callable[..., Dict[str, Any]]:
+    """
+    Import a dialect validator on first use.
+
+    Each validator module exposes an entry point with the same name, so a run
+    only pays for the module its dialect needs.
+    """
+    return getattr(_load(name), name)
+
+
+# Content heuristics as (group name, pattern, dialect). They are fused into a
+# single alternation so the buffer is scanned once; trailing whitespace is
+# matched by lookahead so one hit never swallows the anchor of the next line.
+# Every marker is 7-bit ASCII, so the pattern runs over raw bytes.
+_DIALECT_HEURISTICS = [
+    ("clj_ns", r'^\s*\(ns(?=\s)', DIALECT_CLOJURE),
+    ("clj_as", r'\[.*:as(?=\s)', DIALECT_CLOJURE),
+    ("clj_kw", r'::', DIALECT_CLOJURE),
+    ("rkt_lang", r'^\s*#lang\s+racket', DIALECT_RACKET),
+    ("rkt_mod", r'^\s*\(module(?=\s)', DIALECT_RACKET),
+    ("cl_pkg", r'^\s*\(defpackage(?=\s)', DIALECT_COMMON_LISP),
+    ("cl_in", r'^\s*\(in-package(?=\s)', DIALECT_COMMON_LISP),
+    ("cl_sys", r'^\s*\(defsystem(?=\s)', DIALECT_COMMON_LISP),
+    # Scheme indicators (less distinctive)
+    ("scm_mod", r'^\s*\(define-module(?=\s)', DIALECT_SCHEME),
+]
+
+_DIALECT_RE = re.compile(
+    "|".join(f"(?P<{name}>{pattern})" for name, pattern, _ in _DIALECT_HEURISTICS).encode("ascii"),
+    re.MULTILINE
+)
+
+_GROUP_DIALECTS = {name: dialect for name, _, dialect in _DIALECT_HEURISTICS}
+
+# When several dialects match, the earliest in this list wins
+_DIALECT_PRIORITY = [DIALECT_CLOJURE, DIALECT_RACKET, DIALECT_COMMON_LISP, DIALECT_SCHEME]
+
+# File extension -> dialect
+_EXTENSION_MAP = MappingProxyType({
+    ".clj": DIALECT_CLOJURE,
+    ".cljs": DIALECT_CLOJURE,
+    ".cljc": DIALECT_CLOJURE,
+    ".edn": DIALECT_CLOJURE,
+    ".rkt": DIALECT_RACKET,
+    ".scm": DIALECT_SCHEME,
+    ".ss": DIALECT_SCHEME,
+    ".lisp": DIALECT_COMMON_LISP,
+    ".cl": DIALECT_COMMON_LISP,
+    ".asd": DIALECT_COMMON_LISP,
+    ".el": DIALECT_ELISP
+})
+
+# Extensions that mark a directory's representative source file
+_DIRECTORY_DETECTION_EXTENSIONS = (".clj", ".lisp", ".rkt", ".scm")
+
+def _dialect_from_suffix(suffix: str) -> Optional[str]:
+    """Map a file suffix (e.g. ".clj") to its dialect, case-insensitively."""
+    return _EXTENSION_MAP.get(suffix.lower())
 
 
 def detect_dialect_from_extension(file_path: str) -> Optional[str]:
@@ -97,102 +144,131 @@ def detect_dialect_from_extension(file_path: str) -> Optional[str]:
     Returns:
         Dialect name or None
     """
-    ext = Path(file_path).suffix.lower()
-
-    extension_map = {
-        ".clj": DIALECT_CLOJURE,
-        ".cljs": DIALECT_CLOJURE,
-        ".cljc": DIALECT_CLOJURE,
-        ".edn": DIALECT_CLOJURE,
-        ".rkt": DIALECT_RACKET,
-        ".scm": DIALECT_SCHEME,
-        ".ss": DIALECT_SCHEME,
-        ".lisp": DIALECT_COMMON_LISP,
-        ".cl": DIALECT_COMMON_LISP,
-        ".asd": DIALECT_COMMON_LISP,
-        ".el": DIALECT_ELISP
-    }
-
-    return extension_map.get(ext)
+    return _dialect_from_suffix(os.path.splitext(file_path)[1])
 
 
-def detect_dialect_from_content(content: str) -> Optional[str]:
+def detect_dialect_from_content(content: Union[str, bytes]) -> Optional[str]:
     """
     Detect Lisp dialect from file content using heuristics.
 
     Args:
-        content: File content
+        content: File content (raw bytes are matched without decoding)
 
     Returns:
         Dialect name or None
     """
-    # Clojure indicators
-    if re.search(r'^\s*\(ns\s+', content, re.MULTILINE):
-        return DIALECT_CLOJURE
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+
+    best = None
+    best_rank = len(_DIALECT_PRIORITY)
+
+    for match in _DIALECT_RE.finditer(content):
+        dialect = _GROUP_DIALECTS[match.lastgroup]
+        rank = _DIALECT_PRIORITY.index(dialect)
+        if rank < best_rank:
+            best, best_rank = dialect, rank
+            if rank == 0:
+                break
+
+    return best
+
+
+def detect_file_dialect(file_path: str) -> str:
+    """
+    Detect Lisp dialect of a single file from its extension, then its content.
+
+    Args:
+        file_path: Path to source file
+
+    Returns:
+        Detected dialect or "unknown"
+    """
+    # Try extension first
+    dialect = detect_dialect_from_extension(file_path)
+    if dialect:
+        return dialect
+
+    # Try content analysis (a multi-byte character cut off at the end of
+    # the prefix cannot match an ASCII marker, so truncation is safe)
+    try:
+        with open(file_path, 'rb') as f:
+            content = f.read(DIALECT_DETECTION_BYTES)
+            dialect = detect_dialect_from_content(content)
+            if dialect:
+                return dialect
+    except Exception:
+        pass
 
-    if re.search(r'\[.*:as\s+', content) or '::' in content:
-        return DIALECT_CLOJURE
+    return DIALECT_UNKNOWN
 
-    # Racket indicators
-    if re.search(r'^\s*#lang\s+racket', content, re.MULTILINE):
-        return DIALECT_RACKET
 
-    if re.search(r'^\s*\(module\s+', content, re.MULTILINE):
-        return DIALECT_RACKET
+def _iter_source_files(root: str) -> Iterator[str]:
+    """
+    Yield Lisp source files under root, breadth-first.
 
-    # Common Lisp indicators
-    if re.search(r'^\s*\(defpackage\s+', content, re.MULTILINE):
-        return DIALECT_COMMON_LISP
+    Walks with os.scandir so callers that only need the first hit never
+    list the rest of the tree. Symlinked directories are not followed.
 
-    if re.search(r'^\s*\(in-package\s+', content, re.MULTILINE):
-        return DIALECT_COMMON_LISP
+    Args:
+        root: Directory to search
 
-    if re.search(r'^\s*\(defsystem\s+', content, re.MULTILINE):
-        return DIALECT_COMMON_LISP
+    Yields:
+        Paths of files with a directory-detection extension
+    """
+    pending = deque([root])
 
-    # Scheme indicators (less distinctive)
-    if re.search(r'^\s*\(define-module\s+', content, re.MULTILINE):
-        return DIALECT_SCHEME
+    while pending:
+        directory = pending.popleft()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.name.endswith(_DIRECTORY_DETECTION_EXTENSIONS) and entry.is_file(follow_symlinks=False):
+                        yield entry.path
+        except OSError:
+            continue
 
-    return None
+
+@functools.lru_cache(maxsize=4096)
+def _detect_file_dialect_cached(resolved_path: str, mtime_ns: int) -> str:
+    """Memoized detect_file_dialect; mtime_ns is part of the key so edits invalidate it."""
+    return detect_file_dialect(resolved_path)
 
 
 def detect_dialect(target: str) -> str:
     """
     Auto-detect Lisp dialect from file or directory.
 
+    Results for file targets are cached per resolved path and modification time.
+
     Args:
         target: File or directory path
 
     Returns:
         Detected dialect or "unknown"
     """
-    path = Path(target)
+    # One stat call answers exists / is-dir / is-file and supplies the mtime
+    try:
+        st = os.stat(target)
+    except OSError:
+        return DIALECT_UNKNOWN
 
     # For directories, check first file
-    if path.is_dir():
-        for ext in [".clj", ".lisp", ".rkt", ".scm"]:
-            files = list(path.rglob(f"*{ext}"))
-            if files:
-                target = str(files[0])
-                path = Path(target)
-                break
-
-    # Try extension first
-    if path.is_file():
-        dialect = detect_dialect_from_extension(str(path))
+    if stat.S_ISDIR(st.st_mode):
+        first_file = next(_iter_source_files(target), None)
+        if first_file:
+            return detect_file_dialect(first_file)
+        return DIALECT_UNKNOWN
+
+    if stat.S_ISREG(st.st_mode):
+        # The extension alone settles most files, without touching the cache
+        dialect = detect_dialect_from_extension(target)
         if dialect:
             return dialect
 
-        # Try content analysis
-        try:
-            with open(path, 'r', encoding='utf-8') as f:
-                content = f.read(DIALECT_DETECTION_BYTES)
-                dialect = detect_dialect_from_content(content)
-                if dialect:
-                    return dialect
-        except Exception:
-            pass
+        return _detect_file_dialect_cached(os.path.realpath(target), st.st_mtime_ns)
 
     return DIALECT_UNKNOWN
 
@@ -210,8 +286,7 @@ def validate(target: str, dialect: Optional[str] = None, use_tree_sitter: bool =
         Unified validation results
     """
     # Validate target path exists
-    target_path = Path(target)
-    if not target_path.exists():
+    if not os.path.exists(target):
         return {
             "error": f"Target not found: {target}",
             "target": target,
@@ -242,19 +317,19 @@ def validate(target: str, dialect: Optional[str] = None, use_tree_sitter: bool =
     # Route to appropriate validator
     if use_tree_sitter:
         # Force tree-sitter for incomplete code
-        validator_result = validate_tree_sitter(target)
+        validator_result = _load_validator("validate_tree_sitter")(target)
     elif dialect == DIALECT_CLOJURE:
-        validator_result = validate_clojure(target)
+        validator_result = _load_validator("validate_clojure")(target)
     elif dialect in [DIALECT_RACKET, DIALECT_SCHEME]:
-        validator_result = validate_scheme(target)
+        validator_result = _load_validator("validate_scheme")(target)
     elif dialect == DIALECT_COMMON_LISP:
-        validator_result = validate_common_lisp(target)
+        validator_result = _load_validator("validate_common_lisp")(target)
     elif dialect == DIALECT_ELISP:
         # Elisp: use tree-sitter as primary option
-        validator_result = validate_tree_sitter(target)
+        validator_result = _load_validator("validate_tree_sitter")(target)
     elif dialect == DIALECT_UNKNOWN:
         # Fallback: try tree-sitter
-        validator_result = validate_tree_sitter(target)
+        validator_result = _load_validator("validate_tree_sitter")(target)
         if "warnings" not in result:
             result["warnings"] = []
         result["warnings"].append("Could not auto-detect dialect, using tree-sitter fallback")
@@ -288,7 +363,7 @@ def format_output(result: Dict[str, Any], output_format: str = "json") -> str:
         Formatted string
     """
     if output_format == "json":
-        return json.dumps(result, indent=2)
+        return dumps_json(result)
 
     elif output_format == "text":
         lines = []
@@ -319,49 +394,60 @@ def format_output(result: Dict[str, Any], output_format: str = "json") -> str:
         return f"{summary['total_errors']} errors, {summary['total_warnings']} warnings ({tools})"
 
     else:
-        return json.dumps(result, indent=2)
+        return dumps_json(result)
+
+
+class _ArgumentParser(argparse.ArgumentParser):
+    """ArgumentParser that exits with status 1 on usage errors (2 means EXIT_WARNINGS)."""
+
+    def error(self, message):
+        self.print_usage(sys.stderr)
+        self.exit(1, f"{self.prog}: error: {message}\n")
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser for validate.py."""
+    parser = _ArgumentParser(
+        prog="validate.py",
+        description="Validate Lisp code, auto-detecting the dialect.",
+        epilog=(
+            "Examples:\n"
+            "  validate.py src/\n"
+            "  validate.py file.clj --format text\n"
+            "  validate.py incomplete.lisp --tree-sitter"
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("target", help="File or directory to validate")
+    parser.add_argument(
+        "--dialect",
+        choices=[DIALECT_CLOJURE, DIALECT_RACKET, DIALECT_SCHEME, DIALECT_COMMON_LISP, DIALECT_ELISP],
+        help="Force specific dialect"
+    )
+    parser.add_argument(
+        "--tree-sitter",
+        action="store_true",
+        help="Force tree-sitter validation (for incomplete code)"
+    )
+    parser.add_argument(
+        "--format",
+        dest="output_format",
+        choices=["json", "text", "summary"],
+        default="json",
+        help="Output format [default: json]"
+    )
+    return parser
 
 
 def main():
     """CLI entry point."""
-    if len(sys.argv) < 2:
-        print("Usage: validate.py <file-or-directory> [options]", file=sys.stderr)
-        print("\nOptions:", file=sys.stderr)
-        print("  --dialect <dialect>       Force specific dialect (clojure|racket|scheme|common-lisp|elisp)", file=sys.stderr)
-        print("  --tree-sitter             Force tree-sitter validation (for incomplete code)", file=sys.stderr)
-        print("  --format <format>         Output format (json|text|summary) [default: json]", file=sys.stderr)
-        print("\nExamples:", file=sys.stderr)
-        print("  validate.py src/", file=sys.stderr)
-        print("  validate.py file.clj --format text", file=sys.stderr)
-        print("  validate.py incomplete.lisp --tree-sitter", file=sys.stderr)
-        sys.exit(1)
-
-    target = sys.argv[1]
-
-    # Parse options
-    dialect = None
-    use_tree_sitter = False
-    output_format = "json"
-
-    i = 2
-    while i < len(sys.argv):
-        if sys.argv[i] == "--dialect" and i + 1 < len(sys.argv):
-            dialect = sys.argv[i + 1]
-            i += 2
-        elif sys.argv[i] == "--tree-sitter":
-            use_tree_sitter = True
-            i += 1
-        elif sys.argv[i] == "--format" and i + 1 < len(sys.argv):
-            output_format = sys.argv[i + 1]
-            i += 2
-        else:
-            i += 1
+    args = build_arg_parser().parse_args()
 
     # Validate
-    result = validate(target, dialect=dialect, use_tree_sitter=use_tree_sitter)
+    result = validate(args.target, dialect=args.dialect, use_tree_sitter=args.tree_sitter)
 
     # Output
-    print(format_output(result, output_format))
+    print(format_output(result, args.output_format))
 
     # Exit with appropriate code
     summary = result.get("summary", {})
@@ -22,17 +22,21 @@ Provides structured JSON output optimized for LLM integration.
 """
 
 import json
+import os
 import subprocess
 import sys
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 
 # Import shared types and constants
 try:
     from validation_types import (
         CLJ_KONDO_TIMEOUT_SECONDS, JOKER_TIMEOUT_SECONDS,
-        EXIT_SUCCESS, EXIT_WARNINGS, EXIT_ERRORS
+        EXIT_SUCCESS, EXIT_WARNINGS, EXIT_ERRORS, dumps_json
     )
 except ImportError:
     # Handle when running as script
@@ -47,30 +51,73 @@ except ImportError:
     EXIT_SUCCESS = module.EXIT_SUCCESS
     EXIT_WARNINGS = module.EXIT_WARNINGS
     EXIT_ERRORS = module.EXIT_ERRORS
+    dumps_json = module.dumps_json
+
+# Tool availability is shared with check_tools
+try:
+    from tool_registry import is_tool_available
+except ImportError:
+    # Handle when running as script
+    import importlib.util
+    script_dir = Path(__file__).parent
+    spec = importlib.util.spec_from_file_location("tool_registry", script_dir / "tool_registry.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    is_tool_available = module.is_tool_available
+
+# Repeat runs on unchanged files are served from the result cache
+try:
+    from result_cache import result_cache_key, load_cached_result, store_cached_result
+except ImportError:
+    # Handle when running as script
+    import importlib.util
+    script_dir = Path(__file__).parent
+    spec = importlib.util.spec_from_file_location("result_cache", script_dir / "result_cache.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    result_cache_key = module.result_cache_key
+    load_cached_result = module.load_cached_result
+    store_cached_result = module.store_cached_result
+
+
+# Source files joker lints when given a directory
+_JOKER_EXTENSIONS = (".clj", ".cljs", ".cljc")
+
+# joker output: filename:line:col: type: message
+_JOKER_RE = re.compile(rb'(.+?):(\d+):(\d+):\s*(.+?):\s*(.+)')
 
 
 def run_clj_kondo(target: str) -> Dict[str, Any]:
     """
     Run clj-kondo with JSON output format.
 
+    Directory targets are linted in a single invocation; --parallel lets
+    clj-kondo spread the files across its own worker threads.
+
     Args:
         target: File or directory path to lint
 
     Returns:
         Dict with findings and summary
     """
+    if not is_tool_available("clj-kondo"):
+        return {"error": "clj-kondo not found", "findings": [], "summary": {}}
+
     try:
         result = subprocess.run(
             [
                 "clj-kondo",
                 "--lint", target,
+                "--parallel",
                 "--config", "{:output {:format :json}}"
             ],
             capture_output=True,
-            text=True,
             timeout=CLJ_KONDO_TIMEOUT_SECONDS
         )
 
+        # json.loads decodes the UTF-8 bytes itself
         if result.stdout:
             return json.loads(result.stdout)
         return {"findings": [], "summary": {"error": 0, "warning": 0, "info": 0}}
@@ -85,52 +132,147 @@ def run_clj_kondo(target: str) -> Dict[str, Any]:
         return {"error": f"clj-kondo error: {e}", "findings": [], "summary": {}}
 
 
+def _iter_clj_files(root: str) -> Iterator[str]:
+    """
+    Yield Clojure source files under root in a single directory walk.
+
+    Args:
+        root: Directory to search
+
+    Yields:
+        Paths of .clj, .cljs and .cljc files
+    """
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            if filename.endswith(_JOKER_EXTENSIONS):
+                yield os.path.join(dirpath, filename)
+
+
+def _lint_joker_file(file: str) -> List[Dict[str, Any]]:
+    """
+    Run joker on a single file.
+
+    joker's stderr is parsed line by line as it is written, so parsing
+    overlaps with linting. A timeout is reported against that file only, so
+    one slow file does not discard the results of the rest of the batch.
+    FileNotFoundError is left to the caller, since a missing joker fails
+    every file the same way.
+
+    Args:
+        file: File to lint
+
+    Returns:
+        List of error dictionaries
+    """
+    proc = subprocess.Popen(
+        ["joker", "--lint", "--dialect", "clj", file],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE
+    )
+
+    timed_out = threading.Event()
+
+    def kill() -> None:
+        timed_out.set()
+        proc.kill()
+
+    timer = threading.Timer(JOKER_TIMEOUT_SECONDS, kill)
+    timer.start()
+
+    errors = []
+    try:
+        with proc.stderr:
+            for line in proc.stderr:
+                error = parse_joker_line(line)
+                if error:
+                    errors.append(error)
+        proc.wait()
+    finally:
+        timer.cancel()
+
+    if timed_out.is_set():
+        return [{"error": "joker timed out", "file": file, "tool": "joker"}]
+    return errors
+
+
 def run_joker(target: str) -> List[Dict[str, Any]]:
     """
     Run joker linter for complementary validation.
 
+    Joker analyzes one file at a time, so directory targets lint their files
+    on a thread pool (one joker process per file, bounded by CPU count).
+
     Args:
-        target: File path to lint (joker processes one file at a time)
+        target: File or directory path to lint
 
     Returns:
         List of error dictionaries
     """
     errors = []
 
+    if not is_tool_available("joker"):
+        errors.append({"error": "joker not found", "error_kind": "not_found", "file": target, "tool": "joker"})
+        return errors
+
     try:
-        # Joker analyzes one file at a time
-        target_path = Path(target)
-        if target_path.is_file():
-            files = [target_path]
+        if os.path.isfile(target):
+            files = [target]
         else:
-            files = list(target_path.rglob("*.clj")) + list(target_path.rglob("*.cljs"))
+            files = list(_iter_clj_files(target))
 
-        for file in files:
-            result = subprocess.run(
-                ["joker", "--lint", "--dialect", "clj", str(file)],
-                capture_output=True,
-                text=True,
-                timeout=JOKER_TIMEOUT_SECONDS
-            )
+        if not files:
+            return errors
 
-            if result.stderr:
-                errors.extend(parse_joker_output(result.stderr))
+        max_workers = min(len(files), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # map() yields in submission order, keeping output deterministic
+            for file_errors in executor.map(_lint_joker_file, files):
+                errors.extend(file_errors)
 
     except FileNotFoundError:
-        errors.append({"error": "joker not found", "file": target, "tool": "joker"})
-    except subprocess.TimeoutExpired:
-        errors.append({"error": "joker timed out", "file": target, "tool": "joker"})
+        errors.append({"error": "joker not found", "error_kind": "not_found", "file": target, "tool": "joker"})
     except Exception as e:
         errors.append({"error": f"joker error: {e}", "file": target, "tool": "joker"})
 
     return errors
 
 
-def parse_joker_output(output: str) -> List[Dict[str, Any]]:
+def parse_joker_line(line: bytes) -> Optional[Dict[str, Any]]:
     """
-    Parse joker's text output into structured format.
+    Parse one line of joker output.
     Format: <filename>:<line>:<column>: <issue type>: <message>
 
+    The line is matched as raw bytes; only the captured fields are decoded.
+
+    Args:
+        line: A single line of joker's stderr
+
+    Returns:
+        Error dictionary, or None if the line is not a finding
+    """
+    match = _JOKER_RE.match(line)
+    if not match:
+        return None
+
+    filename, line_num, col, issue_type, message = match.groups()
+
+    severity = "error" if b"error" in issue_type.lower() else "warning"
+
+    return {
+        "file": filename.decode("utf-8", errors="replace"),
+        "line": int(line_num),
+        "col": int(col),
+        "severity": severity,
+        "message": message.strip().decode("utf-8", errors="replace"),
+        "type": issue_type.strip().decode("utf-8", errors="replace"),
+        "tool": "joker"
+    }
+
+
+def parse_joker_output(output: bytes) -> List[Dict[str, Any]]:
+    """
+    Parse joker's text output into structured format.
+
     Args:
         output: stderr output from joker
 
@@ -138,71 +280,110 @@ def parse_joker_output(output: str) -> List[Dict[str, Any]]:
         List of parsed error dictionaries
     """
     errors = []
-    # Pattern: filename:line:col: type: message
-    pattern = r'(.+?):(\d+):(\d+):\s*(.+?):\s*(.+)'
 
-    for line in output.strip().split('\n'):
+    for line in output.splitlines():
         if not line:
             continue
 
-        match = re.match(pattern, line)
-        if match:
-            filename, line_num, col, issue_type, message = match.groups()
-
-            severity = "error" if "error" in issue_type.lower() else "warning"
-
-            errors.append({
-                "file": filename,
-                "line": int(line_num),
-                "col": int(col),
-                "severity": severity,
-                "message": message.strip(),
-                "type": issue_type.strip(),
-                "tool": "joker"
-            })
+        error = parse_joker_line(line)
+        if error:
+            errors.append(error)
 
     return errors
 
 
 def normalize_clj_kondo_findings(findings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
-    Normalize clj-kondo findings to unified format.
+    Normalize clj-kondo findings to unified format, in place.
+
+    The parsed clj-kondo output is used only once, so each finding dict is
+    rewritten rather than copied. Keys are re-inserted in the unified field
+    order; any extra clj-kondo fields (e.g. "langs") are kept ahead of them.
 
     Args:
-        findings: List of findings from clj-kondo
+        findings: List of findings from clj-kondo (modified in place)
 
     Returns:
-        List of normalized error dictionaries
+        The same list, with each finding normalized
     """
-    normalized = []
-
     for finding in findings:
-        normalized.append({
-            "file": finding.get("filename", "unknown"),
-            "line": finding.get("row", 0),
-            "col": finding.get("col", 0),
-            "end_line": finding.get("end-row"),
-            "end_col": finding.get("end-col"),
-            "severity": finding.get("level", "error"),
-            "message": finding.get("message", ""),
-            "type": finding.get("type", "unknown"),
-            "tool": "clj-kondo"
-        })
-
-    return normalized
-
-
-def validate_clojure(target: str, use_joker: bool = True) -> Dict[str, Any]:
+        finding["file"] = finding.pop("filename", "unknown")
+        finding["line"] = finding.pop("row", 0)
+        finding["col"] = finding.pop("col", 0)
+        finding["end_line"] = finding.pop("end-row", None)
+        finding["end_col"] = finding.pop("end-col", None)
+        finding["severity"] = finding.pop("level", "error")
+        finding["message"] = finding.pop("message", "")
+        finding["type"] = finding.pop("type", "unknown")
+        finding["tool"] = "clj-kondo"
+
+    return findings
+
+
+def _find_upwards(start: str, name: str) -> Optional[str]:
+    """Return the nearest start/name, start/../name, ... that exists, if any."""
+    directory = os.path.abspath(start)
+    while True:
+        candidate = os.path.join(directory, name)
+        if os.path.exists(candidate):
+            return candidate
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return None
+        directory = parent
+
+
+def _linter_config_files(target: str) -> List[str]:
+    """
+    List the linter configuration files that apply to a single-file run.
+
+    clj-kondo reads the nearest .clj-kondo/ above the working directory and
+    the user's ~/.config/clj-kondo/config.edn; joker reads the nearest .joker
+    above the file.
+
+    Args:
+        target: File being validated
+
+    Returns:
+        Config file paths (some may not exist)
+    """
+    config_home = os.environ.get("XDG_CONFIG_HOME") or os.path.expanduser("~/.config")
+    files = [os.path.join(config_home, "clj-kondo", "config.edn")]
+
+    kondo_dir = _find_upwards(os.getcwd(), ".clj-kondo")
+    if kondo_dir:
+        files.append(os.path.join(kondo_dir, "config.edn"))
+
+    joker_config = _find_upwards(os.path.dirname(os.path.abspath(target)), ".joker")
+    if joker_config:
+        files.append(joker_config)
+
+    return files
+
+
+def validate_clojure(target: str, use_joker: bool = True, use_cache: bool = False) -> Dict[str, Any]:
     """
     Validate Clojure code using clj-kondo and optionally joker.
 
     Args:
         target: File or directory path to validate
         use_joker: Whether to run joker as secondary validator
+        use_cache: Reuse the cached result for an unchanged single file. The
+            key covers linter config but not the clj-kondo analysis cache, so
+            results for code that depends on other namespaces can go stale
 
     Returns:
         Validation results with findings and summary
     """
+    cache_key = None
+    if use_cache and os.path.isfile(target):
+        tools = ("clj-kondo", "joker") if use_joker else ("clj-kondo",)
+        cache_key = result_cache_key(target, {"dialect": "clojure", "use_joker": use_joker}, tools,
+                                     config_files=_linter_config_files(target))
+        cached = load_cached_result(cache_key) if cache_key else None
+        if cached is not None:
+            return cached
+
     result = {
         "target": target,
         "dialect": "clojure",
@@ -214,8 +395,15 @@ def validate_clojure(target: str, use_joker: bool = True) -> Dict[str, Any]:
         }
     }
 
-    # Run clj-kondo (primary)
-    kondo_result = run_clj_kondo(target)
+    # The two linters are independent processes, so run them side by side
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        kondo_future = executor.submit(run_clj_kondo, target)
+        joker_future = executor.submit(run_joker, target) if use_joker else None
+
+        kondo_result = kondo_future.result()
+        joker_errors = joker_future.result() if joker_future else []
+
+    # Merge clj-kondo (primary)
 
     if "error" in kondo_result:
         result["warnings"] = [kondo_result["error"]]
@@ -228,35 +416,42 @@ def validate_clojure(target: str, use_joker: bool = True) -> Dict[str, Any]:
         result["summary"]["total_errors"] += summary.get("error", 0)
         result["summary"]["total_warnings"] += summary.get("warning", 0)
 
-    # Run joker (secondary)
+    # Merge joker (secondary)
     if use_joker:
-        joker_errors = run_joker(target)
-
-        # Filter out duplicates (same file:line:col)
+        # Filter out duplicates (same file:line:col), including repeats
+        # within joker's own output
         existing_locations = {
             (f["file"], f["line"], f["col"])
             for f in result["findings"]
-        }
+        } if joker_errors else set()
+
+        failed_tools = set()
 
         for error in joker_errors:
             if "error" in error:
                 if "warnings" not in result:
                     result["warnings"] = []
                 result["warnings"].append(error["error"])
+                if error.get("error_kind") == "not_found":
+                    failed_tools.add(error["tool"])
             else:
                 location = (error["file"], error["line"], error["col"])
                 if location not in existing_locations:
+                    existing_locations.add(location)
                     result["findings"].append(error)
                     if error["severity"] == "error":
                         result["summary"]["total_errors"] += 1
                     else:
                         result["summary"]["total_warnings"] += 1
 
-        if "joker not found" not in str(result.get("warnings", [])):
+        if "joker" not in failed_tools:
             result["summary"]["tools_used"].append("joker")
 
     # Sort findings by file, then line, then column
-    result["findings"].sort(key=lambda x: (x["file"], x["line"], x["col"]))
+    result["findings"].sort(key=itemgetter("file", "line", "col"))
+
+    if cache_key:
+        store_cached_result(cache_key, result)
 
     return result
 
@@ -264,16 +459,17 @@ def validate_clojure(target: str, use_joker: bool = True) -> Dict[str, Any]:
 def main():
     """CLI entry point."""
     if len(sys.argv) < 2:
-        print("Usage: validate_clojure.py <file-or-directory> [--no-joker]", file=sys.stderr)
+        print("Usage: validate_clojure.py <file-or-directory> [--no-joker] [--cache]", file=sys.stderr)
         sys.exit(1)
 
     target = sys.argv[1]
     use_joker = "--no-joker" not in sys.argv
+    use_cache = "--cache" in sys.argv
 
-    result = validate_clojure(target, use_joker=use_joker)
+    result = validate_clojure(target, use_joker=use_joker, use_cache=use_cache)
 
     # Output JSON
-    print(json.dumps(result, indent=2))
+    print(dumps_json(result))
 
     # Exit with appropriate code
     if result["summary"]["total_errors"] > 0:
@@ -21,15 +21,87 @@ Common Lisp validation using SBLint (primary) and SBCL (secondary).
 Provides machine-readable output for CI/CD integration.
 """
 
-import json
+import math
 import subprocess
 import sys
 import re
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-
-
-def run_sblint(target: str) -> List[Dict[str, Any]]:
+from typing import List, Dict, Any, Optional, Tuple
+
+# Import shared helpers
+try:
+    from validation_types import SBCL_TIMEOUT_SECONDS, SBLINT_TIMEOUT_SECONDS, dumps_json
+except ImportError:
+    # Handle when running as script
+    import importlib.util
+    script_dir = Path(__file__).parent
+    spec = importlib.util.spec_from_file_location("validation_types", script_dir / "validation_types.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    SBCL_TIMEOUT_SECONDS = module.SBCL_TIMEOUT_SECONDS
+    SBLINT_TIMEOUT_SECONDS = module.SBLINT_TIMEOUT_SECONDS
+    dumps_json = module.dumps_json
+
+# Tool availability is shared with check_tools
+try:
+    from tool_registry import is_tool_available
+except ImportError:
+    # Handle when running as script
+    import importlib.util
+    script_dir = Path(__file__).parent
+    spec = importlib.util.spec_from_file_location("tool_registry", script_dir / "tool_registry.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    is_tool_available = module.is_tool_available
+
+# Repeat runs on unchanged files are served from the result cache
+try:
+    from result_cache import result_cache_key, load_cached_result, store_cached_result
+except ImportError:
+    # Handle when running as script
+    import importlib.util
+    script_dir = Path(__file__).parent
+    spec = importlib.util.spec_from_file_location("result_cache", script_dir / "result_cache.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    result_cache_key = module.result_cache_key
+    load_cached_result = module.load_cached_result
+    store_cached_result = module.store_cached_result
+
+# SBLint output: file:line:col: message
+_SBLINT_RE = re.compile(rb'(.+?):(\d+):(\d+):\s*(.+)')
+
+# SBLint severity keywords, matched anywhere in the message ("warning" also
+# covers "style-warning")
+_SBLINT_ERROR_RE = re.compile(rb'error|undefined|unbound', re.IGNORECASE)
+_SBLINT_WARNING_RE = re.compile(rb'warning', re.IGNORECASE)
+
+# SBCL error block location ("Line: X, Column: Y") and boilerplate to strip
+_SBCL_LINECOL_RE = re.compile(r'Line:\s*(\d+),\s*Column:\s*(\d+)')
+_SBCL_DEBUGGER_RE = re.compile(r'debugger invoked on a [A-Z::-]+:\s*')
+_SBCL_HELP_RE = re.compile(r'Type HELP for debugger help.*')
+
+# Markers that open a new SBCL error block. STYLE-WARNING is listed before
+# WARNING so it is matched as a whole rather than as a plain warning
+_SBCL_BLOCK_RE = re.compile(r'STYLE-WARNING|ERROR|WARNING|NOTE|debugger invoked')
+_SBCL_BLOCK_SEVERITY = {
+    "ERROR": "error",
+    "debugger invoked": "error",
+    "WARNING": "warning",
+    "STYLE-WARNING": "info",
+    "NOTE": "info"
+}
+
+# When a line carries several markers, the most severe one wins
+_SEVERITY_ORDER = ("error", "warning", "info")
+
+
+def run_sblint(target: str) -> Dict[str, List[Dict[str, Any]]]:
     """
     Run SBLint for machine-readable linting.
 
@@ -37,41 +109,47 @@ def run_sblint(target: str) -> List[Dict[str, Any]]:
         target: File or directory path to lint
 
     Returns:
-        List of error dictionaries
+        Dict with "tool_errors" (problems running SBLint) and "findings"
     """
-    errors = []
+    tool_errors = []
+    findings = []
+
+    if not is_tool_available("sblint"):
+        tool_errors.append({"error": "sblint not found (install via: ros install cxxxr/sblint)", "error_kind": "not_found", "tool": "sblint"})
+        return {"tool_errors": tool_errors, "findings": findings}
 
     try:
         result = subprocess.run(
             ["sblint", target],
             capture_output=True,
-            text=True,
-            timeout=60
+            timeout=SBLINT_TIMEOUT_SECONDS
         )
 
         # SBLint outputs to stdout
         if result.stdout:
-            errors.extend(parse_sblint_output(result.stdout))
+            findings.extend(parse_sblint_output(result.stdout))
 
         # Also check stderr for errors
-        if result.stderr and "error" in result.stderr.lower():
-            errors.extend(parse_sblint_output(result.stderr))
+        if result.stderr and b"error" in result.stderr.lower():
+            findings.extend(parse_sblint_output(result.stderr))
 
     except FileNotFoundError:
-        errors.append({"error": "sblint not found (install via: ros install cxxxr/sblint)", "tool": "sblint"})
+        tool_errors.append({"error": "sblint not found (install via: ros install cxxxr/sblint)", "error_kind": "not_found", "tool": "sblint"})
     except subprocess.TimeoutExpired:
-        errors.append({"error": "sblint timed out", "file": target, "tool": "sblint"})
+        tool_errors.append({"error": "sblint timed out", "file": target, "tool": "sblint"})
     except Exception as e:
-        errors.append({"error": f"sblint error: {e}", "file": target, "tool": "sblint"})
+        tool_errors.append({"error": f"sblint error: {e}", "file": target, "tool": "sblint"})
 
-    return errors
+    return {"tool_errors": tool_errors, "findings": findings}
 
 
-def parse_sblint_output(output: str) -> List[Dict[str, Any]]:
+def parse_sblint_output(output: bytes) -> List[Dict[str, Any]]:
     """
     Parse SBLint's machine-readable output.
     Format: file:line:col: message
 
+    The output is matched as raw bytes; only the captured fields are decoded.
+
     Args:
         output: SBLint output
 
@@ -79,49 +157,52 @@ def parse_sblint_output(output: str) -> List[Dict[str, Any]]:
         List of parsed error dictionaries
     """
     errors = []
-    # Pattern: file:line:col: message
-    pattern = r'(.+?):(\d+):(\d+):\s*(.+)'
 
-    for line in output.strip().split('\n'):
+    for line in output.splitlines():
         if not line:
             continue
 
-        match = re.match(pattern, line)
+        match = _SBLINT_RE.match(line)
         if match:
             file, line_num, col, message = match.groups()
 
             # Determine severity from message content
-            message_lower = message.lower()
-            if any(word in message_lower for word in ["error", "undefined", "unbound"]):
+            if _SBLINT_ERROR_RE.search(message):
                 severity = "error"
-            elif any(word in message_lower for word in ["warning", "style-warning"]):
+            elif _SBLINT_WARNING_RE.search(message):
                 severity = "warning"
             else:
                 severity = "info"
 
             errors.append({
-                "file": file,
+                "file": file.decode("utf-8", errors="replace"),
                 "line": int(line_num),
                 "col": int(col),
                 "severity": severity,
-                "message": message.strip(),
+                "message": message.strip().decode("utf-8", errors="replace"),
                 "tool": "sblint"
             })
 
     return errors
 
 
-def run_sbcl_compile_check(target: str) -> List[Dict[str, Any]]:
+def run_sbcl_compile_check(target: str, timeout: float = SBCL_TIMEOUT_SECONDS) -> Dict[str, List[Dict[str, Any]]]:
     """
     Run SBCL compiler for deep semantic validation.
 
     Args:
         target: File path to check
+        timeout: Seconds to wait for SBCL before giving up
 
     Returns:
-        List of error dictionaries
+        Dict with "tool_errors" (problems running SBCL) and "findings"
     """
-    errors = []
+    tool_errors = []
+    findings = []
+
+    if not is_tool_available("sbcl"):
+        tool_errors.append({"error": "sbcl not found", "error_kind": "not_found", "tool": "sbcl"})
+        return {"tool_errors": tool_errors, "findings": findings}
 
     try:
         # Use --noinform to reduce noise, --disable-debugger to exit on error
@@ -135,22 +216,22 @@ def run_sbcl_compile_check(target: str) -> List[Dict[str, Any]]:
             ],
             capture_output=True,
             text=True,
-            timeout=60
+            timeout=timeout
         )
 
         if result.returncode != 0:
             # Parse SBCL's verbose error output
             error_output = result.stderr or result.stdout
-            errors.extend(parse_sbcl_output(error_output, target))
+            findings.extend(parse_sbcl_output(error_output, target))
 
     except FileNotFoundError:
-        errors.append({"error": "sbcl not found", "tool": "sbcl"})
+        tool_errors.append({"error": "sbcl not found", "error_kind": "not_found", "tool": "sbcl"})
     except subprocess.TimeoutExpired:
-        errors.append({"error": "sbcl timed out", "file": target, "tool": "sbcl"})
+        tool_errors.append({"error": "sbcl timed out", "file": target, "tool": "sbcl"})
     except Exception as e:
-        errors.append({"error": f"sbcl error: {e}", "file": target, "tool": "sbcl"})
+        tool_errors.append({"error": f"sbcl error: {e}", "file": target, "tool": "sbcl"})
 
-    return errors
+    return {"tool_errors": tool_errors, "findings": findings}
 
 
 def parse_sbcl_output(output: str, filename: str) -> List[Dict[str, Any]]:
@@ -171,51 +252,52 @@ def parse_sbcl_output(output: str, filename: str) -> List[Dict[str, Any]]:
     """
     errors = []
 
-    # Pattern for "Line: X, Column: Y" format
-    line_col_pattern = r'Line:\s*(\d+),\s*Column:\s*(\d+)'
-
-    # Pattern for "at character X" format
-    char_pattern = r'at character\s+(\d+)'
-
-    # Split into logical error blocks
+    # Split into logical error blocks, noting each block's location as its
+    # lines arrive so the block text is not searched again afterwards
     current_error = None
     current_lines = []
+    current_line_col = None
 
-    for line in output.split('\n'):
+    def finish_block() -> None:
+        error_text = ' '.join(current_lines)
+        error_dict = parse_sbcl_error_block(error_text, filename, current_error, current_line_col or (0, 0))
+        if error_dict:
+            errors.append(error_dict)
+
+    for line in output.splitlines():
         # Check if this is a new error/warning
-        if any(keyword in line for keyword in ["ERROR", "WARNING", "STYLE-WARNING", "NOTE", "debugger invoked"]):
+        markers = _SBCL_BLOCK_RE.findall(line)
+        if markers:
             if current_error and current_lines:
                 # Process previous error
-                error_text = ' '.join(current_lines)
-                error_dict = parse_sbcl_error_block(error_text, filename, current_error)
-                if error_dict:
-                    errors.append(error_dict)
+                finish_block()
 
             # Start new error
-            if "ERROR" in line or "debugger invoked" in line:
-                current_error = "error"
-            elif "WARNING" in line:
-                current_error = "warning"
-            elif "STYLE-WARNING" in line:
-                current_error = "info"
-            else:
-                current_error = "info"
+            severities = {_SBCL_BLOCK_SEVERITY[marker] for marker in markers}
+            current_error = next(severity for severity in _SEVERITY_ORDER if severity in severities)
 
             current_lines = [line]
+            current_line_col = None
         elif current_error:
             current_lines.append(line)
+        else:
+            # Preamble before the first block
+            continue
+
+        if current_line_col is None:
+            line_col_match = _SBCL_LINECOL_RE.search(line)
+            if line_col_match:
+                current_line_col = (int(line_col_match.group(1)), int(line_col_match.group(2)))
 
     # Process final error
     if current_error and current_lines:
-        error_text = ' '.join(current_lines)
-        error_dict = parse_sbcl_error_block(error_text, filename, current_error)
-        if error_dict:
-            errors.append(error_dict)
+        finish_block()
 
     return errors
 
 
-def parse_sbcl_error_block(text: str, filename: str, severity: str) -> Optional[Dict[str, Any]]:
+def parse_sbcl_error_block(text: str, filename: str, severity: str,
+                           line_col: Optional[Tuple[int, int]] = None) -> Optional[Dict[str, Any]]:
     """
     Parse a single SBCL error block.
 
@@ -223,25 +305,28 @@ def parse_sbcl_error_block(text: str, filename: str, severity: str) -> Optional[
         text: Error text
         filename: Source file
         severity: Error severity
+        line_col: Location already found by the caller; searched for in
+            text when not given
 
     Returns:
         Error dictionary or None
     """
-    line = 0
-    col = 0
+    if line_col is None:
+        line_col = (0, 0)
 
-    # Try to extract line and column
-    line_col_match = re.search(r'Line:\s*(\d+),\s*Column:\s*(\d+)', text)
-    if line_col_match:
-        line = int(line_col_match.group(1))
-        col = int(line_col_match.group(2))
+        # Try to extract line and column
+        line_col_match = _SBCL_LINECOL_RE.search(text)
+        if line_col_match:
+            line_col = (int(line_col_match.group(1)), int(line_col_match.group(2)))
+
+    line, col = line_col
 
     # Extract the main error message
     message = text.strip()
 
     # Clean up common SBCL verbosity
-    message = re.sub(r'debugger invoked on a [A-Z::-]+:\s*', '', message)
-    message = re.sub(r'Type HELP for debugger help.*', '', message)
+    message = _SBCL_DEBUGGER_RE.sub('', message)
+    message = _SBCL_HELP_RE.sub('', message)
     message = message.strip()
 
     if not message:
@@ -257,17 +342,31 @@ def parse_sbcl_error_block(text: str, filename: str, severity: str) -> Optional[
     }
 
 
-def validate_common_lisp(target: str, use_sbcl: bool = True) -> Dict[str, Any]:
+def validate_common_lisp(target: str, use_sbcl: bool = True, fast_fail: bool = False,
+                         sbcl_timeout: float = SBCL_TIMEOUT_SECONDS, use_cache: bool = False) -> Dict[str, Any]:
     """
     Validate Common Lisp code using SBLint and optionally SBCL.
 
     Args:
         target: File or directory path to validate
         use_sbcl: Whether to run SBCL for deep validation
+        fast_fail: Run SBLint first and skip SBCL if it already found errors
+        sbcl_timeout: Seconds to wait for SBCL before giving up
+        use_cache: Reuse the cached result for an unchanged single file. Files
+            the code loads or requires are not part of the key, so results can
+            go stale when they change
 
     Returns:
         Validation results with findings and summary
     """
+    cache_key = None
+    if use_cache and Path(target).is_file():
+        options = {"dialect": "common-lisp", "use_sbcl": use_sbcl, "fast_fail": fast_fail}
+        cache_key = result_cache_key(target, options, ("sblint", "sbcl") if use_sbcl else ("sblint",))
+        cached = load_cached_result(cache_key) if cache_key else None
+        if cached is not None:
+            return cached
+
     result = {
         "target": target,
         "dialect": "common-lisp",
@@ -279,48 +378,73 @@ def validate_common_lisp(target: str, use_sbcl: bool = True) -> Dict[str, Any]:
         }
     }
 
-    # Run SBLint (primary)
-    sblint_errors = run_sblint(target)
+    # SBCL (secondary) only checks single files
+    sbcl_enabled = use_sbcl and Path(target).is_file()
+
+    if fast_fail:
+        # SBCL is the slow step; a file SBLint already fails needs no more
+        sblint_result = run_sblint(target)
+        sblint_failed = any(f["severity"] == "error" for f in sblint_result["findings"])
+        sbcl_result = run_sbcl_compile_check(target, sbcl_timeout) if sbcl_enabled and not sblint_failed else None
+    else:
+        # SBLint and SBCL are independent processes, so run them side by side
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            sblint_future = executor.submit(run_sblint, target)
+            sbcl_future = executor.submit(run_sbcl_compile_check, target, sbcl_timeout) if sbcl_enabled else None
+
+            sblint_result = sblint_future.result()
+            sbcl_result = sbcl_future.result() if sbcl_future else None
+
+    # Tools that turned out not to be installed
+    failed_tools = set()
 
-    for error in sblint_errors:
-        if "error" in error and len(error) == 2:  # Tool error
+    def record_tool_errors(tool_errors: List[Dict[str, Any]]) -> None:
+        for error in tool_errors:
             if "warnings" not in result:
                 result["warnings"] = []
             result["warnings"].append(error["error"])
-        else:
-            result["findings"].append(error)
-            if error["severity"] == "error":
-                result["summary"]["total_errors"] += 1
-            elif error["severity"] == "warning":
-                result["summary"]["total_warnings"] += 1
-
-    if "sblint not found" not in str(result.get("warnings", [])):
+            if error.get("error_kind") == "not_found":
+                failed_tools.add(error["tool"])
+
+    def add_finding(finding: Dict[str, Any]) -> None:
+        result["findings"].append(finding)
+        if finding["severity"] == "error":
+            result["summary"]["total_errors"] += 1
+        elif finding["severity"] == "warning":
+            result["summary"]["total_warnings"] += 1
+
+    # Merge SBLint (primary)
+    record_tool_errors(sblint_result["tool_errors"])
+    for finding in sblint_result["findings"]:
+        add_finding(finding)
+
+    if "sblint" not in failed_tools:
         result["summary"]["tools_used"].append("sblint")
 
-    # Run SBCL (secondary) for single files
-    if use_sbcl and Path(target).is_file():
-        sbcl_errors = run_sbcl_compile_check(target)
-
-        # Filter out duplicates
-        existing_messages = {f["message"] for f in result["findings"]}
-
-        for error in sbcl_errors:
-            if "error" in error and len(error) == 2:  # Tool error
-                if "warnings" not in result:
-                    result["warnings"] = []
-                result["warnings"].append(error["error"])
-            elif error["message"] not in existing_messages:
-                result["findings"].append(error)
-                if error["severity"] == "error":
-                    result["summary"]["total_errors"] += 1
-                elif error["severity"] == "warning":
-                    result["summary"]["total_warnings"] += 1
-
-        if "sbcl not found" not in str(result.get("warnings", [])):
+    # Merge SBCL (secondary)
+    if sbcl_result is not None:
+        record_tool_errors(sbcl_result["tool_errors"])
+
+        # Filter out SBCL messages already reported, by SBLint or earlier in
+        # SBCL's own output. SBCL checks a single file and often cannot place
+        # a message (line 0), so match on the message alone rather than its
+        # location
+        sbcl_findings = sbcl_result["findings"]
+        existing_messages = {f["message"] for f in result["findings"]} if sbcl_findings else set()
+
+        for finding in sbcl_findings:
+            if finding["message"] not in existing_messages:
+                existing_messages.add(finding["message"])
+                add_finding(finding)
+
+        if "sbcl" not in failed_tools:
             result["summary"]["tools_used"].append("sbcl")
 
     # Sort findings
-    result["findings"].sort(key=lambda x: (x["file"], x["line"], x["col"]))
+    result["findings"].sort(key=itemgetter("file", "line", "col"))
+
+    if cache_key:
+        store_cached_result(cache_key, result)
 
     return result
 
@@ -328,16 +452,37 @@ def validate_common_lisp(target: str, use_sbcl: bool = True) -> Dict[str, Any]:
 def main():
     """CLI entry point."""
     if len(sys.argv) < 2:
-        print("Usage: validate_common_lisp.py <file-or-directory> [--no-sbcl]", file=sys.stderr)
+        print("Usage: validate_common_lisp.py <file-or-directory> [--no-sbcl] [--fast-fail] [--sbcl-timeout SECONDS] "
+              "[--cache]", file=sys.stderr)
         sys.exit(1)
 
     target = sys.argv[1]
     use_sbcl = "--no-sbcl" not in sys.argv
-
-    result = validate_common_lisp(target, use_sbcl=use_sbcl)
+    fast_fail = "--fast-fail" in sys.argv
+    use_cache = "--cache" in sys.argv
+
+    # Parse SBCL timeout option
+    sbcl_timeout = SBCL_TIMEOUT_SECONDS
+    for i, arg in enumerate(sys.argv):
+        if arg == "--sbcl-timeout":
+            if i + 1 >= len(sys.argv):
+                print("--sbcl-timeout requires a value in seconds", file=sys.stderr)
+                sys.exit(1)
+            try:
+                sbcl_timeout = float(sys.argv[i + 1])
+            except ValueError:
+                sbcl_timeout = math.nan
+            # 0, negatives, inf and nan all parse as floats but are not usable timeouts
+            if not (math.isfinite(sbcl_timeout) and sbcl_timeout > 0):
+                print(f"Invalid --sbcl-timeout value: {sys.argv[i + 1]} (expected a positive number of seconds)",
+                      file=sys.stderr)
+                sys.exit(1)
+
+    result = validate_common_lisp(target, use_sbcl=use_sbcl, fast_fail=fast_fail, sbcl_timeout=sbcl_timeout,
+                                  use_cache=use_cache)
 
     # Output JSON
-    print(json.dumps(result, indent=2))
+    print(dumps_json(result))
 
     # Exit with appropriate code
     if result["summary"]["total_errors"] > 0:
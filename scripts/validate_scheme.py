@@ -21,123 +21,192 @@ Racket/Scheme validation using raco tools (primary) with fallback to dialect-spe
 raco tools work for both Racket and generic Scheme when available.
 """
 
-import json
+import os
 import subprocess
 import sys
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-
-
+from typing import List, Dict, Any, Callable, Optional, Tuple
+
+# Import shared helpers
+try:
+    from validation_types import Finding, dumps_json
+except ImportError:
+    # Handle when running as script
+    import importlib.util
+    script_dir = Path(__file__).parent
+    spec = importlib.util.spec_from_file_location("validation_types", script_dir / "validation_types.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    Finding = module.Finding
+    dumps_json = module.dumps_json
+
+# The raco parsers scan the whole output with one finditer. Patterns are
+# anchored per line, and [^\S\n] (whitespace other than newline) keeps every
+# match within a single line, as the old line-by-line matching did.
+
+# raco expand errors: file:line:column: message, or any other line that
+# mentions an error or unbound identifier
+_RACO_ERR_RE = re.compile(
+    r'^(?:(?P<file>.+?):(?P<line>\d+):(?P<col>\d+):[^\S\n]*(?P<message>.+)'
+    r'|(?P<unstructured>.*(?i:error|unbound).*))$',
+    re.MULTILINE
+)
+
+# raco review/warn structured output: filename:line:col:level:message
+_RACO_STRUCT_RE = re.compile(r'^(.+?):(\d+):(\d+):(error|warning|info):[^\S\n]*(.+)', re.MULTILINE)
+
+# raco warn output with an optional trailing suggestion
+_RACO_WARN_RE = re.compile(
+    r'^(.+?):(\d+):(\d+):(warning|error|info):[^\S\n]*(.+?)(?:[^\S\n]+suggestion:[^\S\n]*(.+))?$',
+    re.MULTILINE
+)
+
+# Lines of dialect-specific Scheme output that report a problem
+_FALLBACK_KEYWORDS_RE = re.compile(r'error|unbound|undefined|syntax', re.IGNORECASE)
+
+
+@lru_cache(maxsize=None)
 def check_raco_available() -> bool:
     """Check if raco is available on the system."""
     try:
-        subprocess.run(["raco", "version"], capture_output=True, timeout=5)
+        # Only the exit matters, so don't allocate pipes for the output
+        subprocess.run(
+            ["raco", "version"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=5
+        )
         return True
     except (FileNotFoundError, subprocess.TimeoutExpired):
         return False
 
 
-def run_raco_expand(target: str) -> List[Dict[str, Any]]:
+def _decode_output(output: bytes) -> str:
     """
-    Run raco expand for safe syntax checking without execution.
+    Decode captured raco output.
+
+    raco output is captured as bytes and decoded here with the UTF-8 codec
+    rather than through text mode's locale codec, and a stray invalid byte
+    becomes U+FFFD instead of failing the whole run.
 
     Args:
-        target: File path to check
+        output: Captured stdout or stderr
 
     Returns:
-        List of error dictionaries
+        Decoded output
     """
-    errors = []
+    return output.decode("utf-8", errors="replace")
+
+
+def _run_raco(subcommand: str, targets: List[str], timeout: int,
+              parse: Callable[[str], List[Finding]], not_found: Dict[str, str],
+              use_stderr: bool = False) -> Dict[str, List[Any]]:
+    """
+    Run one raco subcommand and parse its report.
+
+    Args:
+        subcommand: raco subcommand (expand, review, warn)
+        targets: File or directory paths to pass to raco
+        timeout: Timeout in seconds
+        parse: Parser for the decoded report
+        not_found: Tool error fields to report when raco can't be started
+        use_stderr: Parse stderr, and only on a non-zero exit, rather than stdout
+
+    Returns:
+        Dict with "tool_errors" (problems running raco) and "findings"
+    """
+    tool = f"raco-{subcommand}"
+    target = " ".join(targets)
+    tool_errors = []
+    findings = []
 
     try:
         result = subprocess.run(
-            ["raco", "expand", target],
+            ["raco", subcommand, *targets],
             capture_output=True,
-            text=True,
-            timeout=30
+            timeout=timeout
         )
 
-        if result.returncode != 0 and result.stderr:
-            errors.extend(parse_raco_errors(result.stderr, target, "raco-expand"))
+        if use_stderr:
+            output = result.stderr if result.returncode != 0 else b""
+        else:
+            output = result.stdout
+
+        if output:
+            findings.extend(parse(_decode_output(output)))
 
     except FileNotFoundError:
-        errors.append({"error": "raco not found", "tool": "raco-expand"})
+        tool_errors.append({**not_found, "tool": tool})
     except subprocess.TimeoutExpired:
-        errors.append({"error": "raco expand timed out", "file": target, "tool": "raco-expand"})
+        tool_errors.append({"error": f"raco {subcommand} timed out", "file": target, "tool": tool})
     except Exception as e:
-        errors.append({"error": f"raco expand error: {e}", "file": target, "tool": "raco-expand"})
+        tool_errors.append({"error": f"raco {subcommand} error: {e}", "file": target, "tool": tool})
 
-    return errors
+    return {"tool_errors": tool_errors, "findings": findings}
 
 
-def run_raco_review(target: str) -> List[Dict[str, Any]]:
+def run_raco_expand(target: str) -> Dict[str, List[Any]]:
     """
-    Run raco review for fast surface-level linting.
+    Run raco expand for safe syntax checking without execution.
 
     Args:
-        target: File or directory path to review
+        target: File path to check
 
     Returns:
-        List of error dictionaries
+        Dict with "tool_errors" (problems running raco expand) and "findings"
     """
-    errors = []
+    return _run_raco(
+        "expand", [target], 30,
+        lambda output: parse_raco_errors(output, target, "raco-expand"),
+        not_found={"error": "raco not found"},
+        use_stderr=True
+    )
 
-    try:
-        result = subprocess.run(
-            ["raco", "review", target],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
 
-        if result.stdout:
-            errors.extend(parse_raco_structured_output(result.stdout, "raco-review"))
+def run_raco_review(targets: List[str]) -> Dict[str, List[Any]]:
+    """
+    Run raco review for fast surface-level linting.
 
-    except FileNotFoundError:
-        errors.append({"error": "raco review not installed (run: raco pkg install review)", "tool": "raco-review"})
-    except subprocess.TimeoutExpired:
-        errors.append({"error": "raco review timed out", "file": target, "tool": "raco-review"})
-    except Exception as e:
-        errors.append({"error": f"raco review error: {e}", "file": target, "tool": "raco-review"})
+    All targets are passed to a single raco process so Racket starts once.
 
-    return errors
+    Args:
+        targets: File or directory paths to review
+
+    Returns:
+        Dict with "tool_errors" (problems running raco review) and "findings"
+    """
+    return _run_raco(
+        "review", targets, 30 * len(targets),
+        lambda output: parse_raco_structured_output(output, "raco-review"),
+        not_found={"error": "raco review not installed (run: raco pkg install review)", "error_kind": "not_installed"}
+    )
 
 
-def run_raco_warn(target: str) -> List[Dict[str, Any]]:
+def run_raco_warn(targets: List[str]) -> Dict[str, List[Any]]:
     """
     Run raco warn for comprehensive analysis.
 
+    All targets are passed to a single raco process so Racket starts once.
+
     Args:
-        target: File or directory path to check
+        targets: File or directory paths to check
 
     Returns:
-        List of error dictionaries
+        Dict with "tool_errors" (problems running raco warn) and "findings"
     """
-    errors = []
-
-    try:
-        result = subprocess.run(
-            ["raco", "warn", target],
-            capture_output=True,
-            text=True,
-            timeout=60
-        )
+    return _run_raco(
+        "warn", targets, 60 * len(targets),
+        lambda output: parse_raco_warn_output(output, "raco-warn"),
+        not_found={"error": "raco warn not installed (run: raco pkg install syntax-warn)", "error_kind": "not_installed"}
+    )
 
-        if result.stdout:
-            errors.extend(parse_raco_warn_output(result.stdout, "raco-warn"))
 
-    except FileNotFoundError:
-        errors.append({"error": "raco warn not installed (run: raco pkg install syntax-warn)", "tool": "raco-warn"})
-    except subprocess.TimeoutExpired:
-        errors.append({"error": "raco warn timed out", "file": target, "tool": "raco-warn"})
-    except Exception as e:
-        errors.append({"error": f"raco warn error: {e}", "file": target, "tool": "raco-warn"})
-
-    return errors
-
-
-def parse_raco_errors(output: str, filename: str, tool: str) -> List[Dict[str, Any]]:
+def parse_raco_errors(output: str, filename: str, tool: str) -> List[Finding]:
     """
     Parse raco error messages (typically from stderr).
     Format: file:line:column: message
@@ -148,41 +217,36 @@ def parse_raco_errors(output: str, filename: str, tool: str) -> List[Dict[str, A
         tool: Tool name for tracking
 
     Returns:
-        List of parsed error dictionaries
+        List of parsed findings
     """
     errors = []
-    pattern = r'(.+?):(\d+):(\d+):\s*(.+)'
-
-    for line in output.strip().split('\n'):
-        if not line:
-            continue
-
-        match = re.match(pattern, line)
-        if match:
-            file, line_num, col, message = match.groups()
-            errors.append({
-                "file": file,
-                "line": int(line_num),
-                "col": int(col),
-                "severity": "error",
-                "message": message.strip(),
-                "tool": tool
-            })
-        elif "error" in line.lower() or "unbound" in line.lower():
+
+    for match in _RACO_ERR_RE.finditer(output.strip()):
+        unstructured = match.group("unstructured")
+        if unstructured is None:
+            errors.append(Finding(
+                file=match.group("file"),
+                line=int(match.group("line")),
+                col=int(match.group("col")),
+                severity="error",
+                message=match.group("message").strip(),
+                tool=tool
+            ))
+        else:
             # Catch unstructured error messages
-            errors.append({
-                "file": filename,
-                "line": 0,
-                "col": 0,
-                "severity": "error",
-                "message": line.strip(),
-                "tool": tool
-            })
+            errors.append(Finding(
+                file=filename,
+                line=0,
+                col=0,
+                severity="error",
+                message=unstructured.strip(),
+                tool=tool
+            ))
 
     return errors
 
 
-def parse_raco_structured_output(output: str, tool: str) -> List[Dict[str, Any]]:
+def parse_raco_structured_output(output: str, tool: str) -> List[Finding]:
     """
     Parse raco review/warn structured output.
     Format: filename:line:col:level:message
@@ -192,32 +256,25 @@ def parse_raco_structured_output(output: str, tool: str) -> List[Dict[str, Any]]
         tool: Tool name for tracking
 
     Returns:
-        List of parsed error dictionaries
+        List of parsed findings
     """
     errors = []
-    # Pattern: filename:line:col:level:message
-    pattern = r'(.+?):(\d+):(\d+):(error|warning|info):\s*(.+)'
-
-    for line in output.strip().split('\n'):
-        if not line:
-            continue
-
-        match = re.match(pattern, line)
-        if match:
-            file, line_num, col, level, message = match.groups()
-            errors.append({
-                "file": file,
-                "line": int(line_num),
-                "col": int(col),
-                "severity": level,
-                "message": message.strip(),
-                "tool": tool
-            })
+
+    for match in _RACO_STRUCT_RE.finditer(output.strip()):
+        file, line_num, col, level, message = match.groups()
+        errors.append(Finding(
+            file=file,
+            line=int(line_num),
+            col=int(col),
+            severity=level,
+            message=message.strip(),
+            tool=tool
+        ))
 
     return errors
 
 
-def parse_raco_warn_output(output: str, tool: str) -> List[Dict[str, Any]]:
+def parse_raco_warn_output(output: str, tool: str) -> List[Finding]:
     """
     Parse raco warn output with suggestions.
     Format: file:line:col:level: message (code) suggestion: action
@@ -227,38 +284,27 @@ def parse_raco_warn_output(output: str, tool: str) -> List[Dict[str, Any]]:
         tool: Tool name for tracking
 
     Returns:
-        List of parsed error dictionaries
+        List of parsed findings
     """
     errors = []
-    # More complex pattern with optional suggestion
-    pattern = r'(.+?):(\d+):(\d+):(warning|error|info):\s*(.+?)(?:\s+suggestion:\s*(.+))?$'
-
-    for line in output.strip().split('\n'):
-        if not line:
-            continue
-
-        match = re.match(pattern, line)
-        if match:
-            file, line_num, col, level, message, suggestion = match.groups()
-
-            error_dict = {
-                "file": file,
-                "line": int(line_num),
-                "col": int(col),
-                "severity": level,
-                "message": message.strip(),
-                "tool": tool
-            }
 
-            if suggestion:
-                error_dict["suggestion"] = suggestion.strip()
+    for match in _RACO_WARN_RE.finditer(output.strip()):
+        file, line_num, col, level, message, suggestion = match.groups()
 
-            errors.append(error_dict)
+        errors.append(Finding(
+            file=file,
+            line=int(line_num),
+            col=int(col),
+            severity=level,
+            message=message.strip(),
+            tool=tool,
+            suggestion=suggestion.strip() if suggestion else None
+        ))
 
     return errors
 
 
-def run_fallback_scheme_validator(target: str, dialect: str = "guile") -> List[Dict[str, Any]]:
+def run_fallback_scheme_validator(target: str, dialect: str = "guile") -> Dict[str, List[Any]]:
     """
     Fallback to dialect-specific Scheme validators when raco is unavailable.
 
@@ -267,9 +313,10 @@ def run_fallback_scheme_validator(target: str, dialect: str = "guile") -> List[D
         dialect: Scheme dialect (guile, chez, chicken, mit)
 
     Returns:
-        List of error dictionaries
+        Dict with "tool_errors" (problems running the Scheme implementation) and "findings"
     """
-    errors = []
+    tool_errors = []
+    findings = []
 
     validators = {
         "guile": ["guile", "-c", f'(load "{target}")'],
@@ -279,7 +326,8 @@ def run_fallback_scheme_validator(target: str, dialect: str = "guile") -> List[D
     }
 
     if dialect not in validators:
-        return [{"error": f"Unknown Scheme dialect: {dialect}"}]
+        tool_errors.append({"error": f"Unknown Scheme dialect: {dialect}"})
+        return {"tool_errors": tool_errors, "findings": findings}
 
     try:
         result = subprocess.run(
@@ -294,114 +342,222 @@ def run_fallback_scheme_validator(target: str, dialect: str = "guile") -> List[D
             error_output = result.stderr or result.stdout
 
             # Generic parsing for unstructured Scheme errors
-            for line in error_output.split('\n'):
-                if any(keyword in line.lower() for keyword in ["error", "unbound", "undefined", "syntax"]):
-                    errors.append({
-                        "file": target,
-                        "line": 0,
-                        "col": 0,
-                        "severity": "error",
-                        "message": line.strip(),
-                        "tool": f"scheme-{dialect}"
-                    })
+            for line in error_output.splitlines():
+                if _FALLBACK_KEYWORDS_RE.search(line):
+                    findings.append(Finding(
+                        file=target,
+                        line=0,
+                        col=0,
+                        severity="error",
+                        message=line.strip(),
+                        tool=f"scheme-{dialect}"
+                    ))
 
     except FileNotFoundError:
-        errors.append({"error": f"{dialect} not found", "tool": f"scheme-{dialect}"})
+        tool_errors.append({"error": f"{dialect} not found", "tool": f"scheme-{dialect}"})
     except subprocess.TimeoutExpired:
-        errors.append({"error": f"{dialect} timed out", "file": target, "tool": f"scheme-{dialect}"})
+        tool_errors.append({"error": f"{dialect} timed out", "file": target, "tool": f"scheme-{dialect}"})
     except Exception as e:
-        errors.append({"error": f"{dialect} error: {e}", "file": target, "tool": f"scheme-{dialect}"})
+        tool_errors.append({"error": f"{dialect} error: {e}", "file": target, "tool": f"scheme-{dialect}"})
 
-    return errors
+    return {"tool_errors": tool_errors, "findings": findings}
 
 
-def validate_scheme(target: str, use_raco: bool = True, scheme_dialect: str = "guile") -> Dict[str, Any]:
+def _route_findings(findings: List[Finding], targets: List[str]) -> Tuple[Dict[str, List[Finding]], List[Finding]]:
     """
-    Validate Racket/Scheme code using raco tools or dialect-specific validators.
+    Group findings from a batched raco run by the target they belong to.
+
+    A finding belongs to a target when its file is that target, or lies
+    under it when the target is a directory. With a single target every
+    finding belongs to it. With several, a finding for a file that matches
+    no target (raco reporting a dependency, say) is returned separately
+    rather than charged to an unrelated target.
 
     Args:
-        target: File or directory path to validate
+        findings: Findings from one or more raco runs
+        targets: Targets passed to raco
+
+    Returns:
+        (routed, unmatched) - routed maps every target to its findings;
+        unmatched holds findings that belong to no target
+    """
+    routed = {target: [] for target in targets}
+    unmatched = []
+
+    if len(targets) == 1:
+        routed[targets[0]].extend(findings)
+        return routed, unmatched
+
+    resolved = [(os.path.realpath(target), target) for target in targets]
+    owners = {}
+
+    for finding in findings:
+        file = finding.file
+        if file not in owners:
+            real_file = os.path.realpath(file)
+            owner = None
+            for real_target, target in resolved:
+                if real_file == real_target or real_file.startswith(real_target + os.sep):
+                    owner = target
+                    break
+            owners[file] = owner
+
+        owner = owners[file]
+        if owner is None:
+            unmatched.append(finding)
+        else:
+            routed[owner].append(finding)
+
+    return routed, unmatched
+
+
+def validate_scheme_batch(targets: List[str], use_raco: bool = True,
+                          scheme_dialect: str = "guile") -> Tuple[Dict[str, Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Validate several Racket/Scheme targets with shared raco invocations.
+
+    raco review and raco warn each run once over all targets, so Racket's
+    startup cost is paid once per tool rather than once per file. raco expand
+    stops at the first file that fails to expand, and its unstructured errors
+    carry no file name, so it still runs once per target, in parallel with
+    the batched checks.
+
+    Args:
+        targets: File or directory paths to validate
         use_raco: Whether to use raco tools (if available)
         scheme_dialect: Fallback Scheme dialect if raco unavailable
 
     Returns:
-        Validation results with findings and summary
+        (results, unmatched) - results maps each target to its validation
+        results with findings and summary; unmatched lists batched raco
+        findings for files outside every target, which count toward no
+        target's summary
     """
-    result = {
-        "target": target,
-        "dialect": "racket/scheme",
-        "findings": [],
-        "summary": {
-            "total_errors": 0,
-            "total_warnings": 0,
-            "tools_used": []
-        }
-    }
+    tools_used = []
+    routed = {}
+    unmatched = []
 
     raco_available = check_raco_available() if use_raco else False
 
     if raco_available:
-        # Use raco tools (works for Racket and generic Scheme)
+        # Use raco tools (works for Racket and generic Scheme). The checks
+        # are independent processes, so run them side by side
+        workers = min(len(targets), os.cpu_count() or 1) + 2
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            review_future = executor.submit(run_raco_review, targets)
+            warn_future = executor.submit(run_raco_warn, targets)
+            expand_runs = dict(zip(targets, executor.map(run_raco_expand, targets)))
+
+            review_run = review_future.result()
+            warn_run = warn_future.result()
+
         # Fast check first
-        expand_errors = run_raco_expand(target)
-        result["findings"].extend([e for e in expand_errors if "error" not in e])
-        result["summary"]["tools_used"].append("raco-expand")
-
-        # Surface lint
-        review_errors = run_raco_review(target)
-        result["findings"].extend([e for e in review_errors if "error" not in e])
-        if review_errors and "not installed" not in str(review_errors[0]):
-            result["summary"]["tools_used"].append("raco-review")
-
-        # Deep analysis
-        warn_errors = run_raco_warn(target)
-        result["findings"].extend([e for e in warn_errors if "error" not in e])
-        if warn_errors and "not installed" not in str(warn_errors[0]):
-            result["summary"]["tools_used"].append("raco-warn")
+        for target, run in expand_runs.items():
+            routed.setdefault(target, []).extend(run["findings"])
+        tools_used.append("raco-expand")
+
+        # Surface lint, then deep analysis. A tool is listed as used when it
+        # produced output, unless it turned out not to be installed
+        for tool, run in (("raco-review", review_run), ("raco-warn", warn_run)):
+            run_routed, run_unmatched = _route_findings(run["findings"], targets)
+            for target, findings in run_routed.items():
+                routed.setdefault(target, []).extend(findings)
+            unmatched.extend(run_unmatched)
+            if run["findings"] or any(e.get("error_kind") != "not_installed" for e in run["tool_errors"]):
+                tools_used.append(tool)
 
     else:
         # Fallback to dialect-specific validators
-        fallback_errors = run_fallback_scheme_validator(target, scheme_dialect)
-        result["findings"].extend([e for e in fallback_errors if "error" not in e])
-        result["summary"]["tools_used"].append(f"scheme-{scheme_dialect}")
+        for target in targets:
+            routed[target] = run_fallback_scheme_validator(target, scheme_dialect)["findings"]
+        tools_used.append(f"scheme-{scheme_dialect}")
+
+    results = {}
+
+    for target, findings in routed.items():
+        # Sort findings
+        findings.sort(key=attrgetter("file", "line", "col"))
+
+        result = {
+            "target": target,
+            "dialect": "racket/scheme",
+            "findings": [finding.to_dict() for finding in findings],
+            "summary": {
+                "total_errors": 0,
+                "total_warnings": 0,
+                "tools_used": list(tools_used)
+            }
+        }
 
-    # Count errors and warnings
-    for finding in result["findings"]:
-        if finding.get("severity") == "error":
-            result["summary"]["total_errors"] += 1
-        elif finding.get("severity") == "warning":
-            result["summary"]["total_warnings"] += 1
+        # Count errors and warnings
+        for finding in findings:
+            if finding.severity == "error":
+                result["summary"]["total_errors"] += 1
+            elif finding.severity == "warning":
+                result["summary"]["total_warnings"] += 1
 
-    # Sort findings
-    result["findings"].sort(key=lambda x: (x.get("file", ""), x.get("line", 0), x.get("col", 0)))
+        results[target] = result
 
-    return result
+    unmatched.sort(key=attrgetter("file", "line", "col"))
+
+    return results, [finding.to_dict() for finding in unmatched]
+
+
+def validate_scheme(target: str, use_raco: bool = True, scheme_dialect: str = "guile") -> Dict[str, Any]:
+    """
+    Validate Racket/Scheme code using raco tools or dialect-specific validators.
+
+    Args:
+        target: File or directory path to validate
+        use_raco: Whether to use raco tools (if available)
+        scheme_dialect: Fallback Scheme dialect if raco unavailable
+
+    Returns:
+        Validation results with findings and summary
+    """
+    # A single target owns every finding, so nothing comes back unmatched
+    results, _ = validate_scheme_batch([target], use_raco=use_raco, scheme_dialect=scheme_dialect)
+    return results[target]
 
 
 def main():
     """CLI entry point."""
     if len(sys.argv) < 2:
-        print("Usage: validate_scheme.py <file-or-directory> [--no-raco] [--dialect guile|chez|chicken|mit]", file=sys.stderr)
+        print("Usage: validate_scheme.py <file-or-directory>... [--no-raco] [--dialect guile|chez|chicken|mit]", file=sys.stderr)
         sys.exit(1)
 
-    target = sys.argv[1]
     use_raco = "--no-raco" not in sys.argv
 
-    # Parse dialect option
+    # Parse dialect option; everything else that is not a flag is a target
     scheme_dialect = "guile"
-    for i, arg in enumerate(sys.argv):
-        if arg == "--dialect" and i + 1 < len(sys.argv):
-            scheme_dialect = sys.argv[i + 1]
+    targets = []
+    args = iter(sys.argv[1:])
+    for arg in args:
+        if arg == "--dialect":
+            scheme_dialect = next(args, scheme_dialect)
+        elif not arg.startswith("--"):
+            targets.append(arg)
+
+    if not targets:
+        print("Usage: validate_scheme.py <file-or-directory>... [--no-raco] [--dialect guile|chez|chicken|mit]", file=sys.stderr)
+        sys.exit(1)
+
+    batch, unmatched = validate_scheme_batch(targets, use_raco=use_raco, scheme_dialect=scheme_dialect)
+    results = list(batch.values())
 
-    result = validate_scheme(target, use_raco=use_raco, scheme_dialect=scheme_dialect)
+    # Output JSON: a single result object for one target, a list for several
+    print(dumps_json(results[0] if len(targets) == 1 else results))
 
-    # Output JSON
-    print(json.dumps(result, indent=2))
+    # Findings outside every target (e.g. in a dependency) are reported, but
+    # don't affect any target's result or the exit code
+    for finding in unmatched:
+        print(f"warning: {finding['tool']} reported {finding['file']}:{finding['line']}:{finding['col']}, "
+              f"outside every target: {finding['message']}", file=sys.stderr)
 
     # Exit with appropriate code
-    if result["summary"]["total_errors"] > 0:
+    if any(result["summary"]["total_errors"] > 0 for result in results):
         sys.exit(3)
-    elif result["summary"]["total_warnings"] > 0:
+    elif any(result["summary"]["total_warnings"] > 0 for result in results):
         sys.exit(2)
     else:
         sys.exit(0)
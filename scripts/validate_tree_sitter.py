@@ -23,18 +23,21 @@ Critical for LLM workflows where code may be partially generated.
 Handles incomplete expressions that traditional readers would reject.
 """
 
-import json
+import os
 import subprocess
 import sys
 import re
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from types import MappingProxyType
+from typing import List, Dict, Any, Iterable, Optional, Tuple
 
 # Import shared types and constants
 try:
     from validation_types import (
-        TREE_SITTER_TIMEOUT_SECONDS, MAX_ERROR_TEXT_LENGTH,
-        EXIT_SUCCESS, EXIT_WARNINGS, EXIT_ERRORS
+        TREE_SITTER_TIMEOUT_SECONDS, TOOL_CHECK_TIMEOUT_SECONDS, MAX_ERROR_TEXT_LENGTH,
+        EXIT_SUCCESS, EXIT_WARNINGS, EXIT_ERRORS, Finding, dumps_json
     )
 except ImportError:
     # Handle when running as script
@@ -45,26 +48,61 @@ except ImportError:
     spec.loader.exec_module(module)
 
     TREE_SITTER_TIMEOUT_SECONDS = module.TREE_SITTER_TIMEOUT_SECONDS
+    TOOL_CHECK_TIMEOUT_SECONDS = module.TOOL_CHECK_TIMEOUT_SECONDS
     MAX_ERROR_TEXT_LENGTH = module.MAX_ERROR_TEXT_LENGTH
     EXIT_SUCCESS = module.EXIT_SUCCESS
     EXIT_WARNINGS = module.EXIT_WARNINGS
     EXIT_ERRORS = module.EXIT_ERRORS
-
-
+    Finding = module.Finding
+    dumps_json = module.dumps_json
+
+# File extension -> tree-sitter grammar
+_GRAMMAR_MAP = MappingProxyType({
+    ".clj": "clojure",
+    ".cljs": "clojure",
+    ".cljc": "clojure",
+    ".lisp": "commonlisp",
+    ".cl": "commonlisp",
+    ".asd": "commonlisp",
+    ".el": "elisp",
+    ".rkt": "racket",  # if tree-sitter-racket available
+    ".scm": "scheme"   # generic
+})
+
+# Grammar -> Python binding module (pip install tree-sitter-<grammar>)
+_PY_GRAMMAR_MODULES = MappingProxyType({
+    "commonlisp": "tree_sitter_commonlisp",
+    "clojure": "tree_sitter_clojure",
+    "elisp": "tree_sitter_elisp"
+})
+
+# Grammar -> loaded tree-sitter Language, filled in on first use
+_TS_LANGS: Dict[str, Any] = {}
+
+# Grammar -> Parser bound to that language, reused across files
+_PARSERS: Dict[str, Any] = {}
+
+# tree-sitter CLI parse tree nodes, matched in one pass:
+#   ERROR [row, col] - [row, col]
+#   MISSING <node type> [row, col]
+_TS_NODE_RE = re.compile(
+    rb'(?P<error>ERROR\s+\[(?P<start_row>\d+),\s*(?P<start_col>\d+)\]\s*-\s*'
+    rb'\[(?P<end_row>\d+),\s*(?P<end_col>\d+)\])'
+    rb'|(?P<missing>MISSING\s+(?P<node_type>.+?)\s+\[(?P<row>\d+),\s*(?P<col>\d+)\])'
+)
+
+
+@lru_cache(maxsize=None)
 def check_tree_sitter_available() -> bool:
     """Check if tree-sitter CLI is available."""
     try:
-        from validation_types import TOOL_CHECK_TIMEOUT_SECONDS
-    except ImportError:
-        import importlib.util
-        script_dir = Path(__file__).parent
-        spec = importlib.util.spec_from_file_location("validation_types", script_dir / "validation_types.py")
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
-        TOOL_CHECK_TIMEOUT_SECONDS = module.TOOL_CHECK_TIMEOUT_SECONDS
-
-    try:
-        subprocess.run(["tree-sitter", "--version"], capture_output=True, timeout=TOOL_CHECK_TIMEOUT_SECONDS)
+        # Only the exit matters, so don't allocate pipes for the output
+        subprocess.run(
+            ["tree-sitter", "--version"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=TOOL_CHECK_TIMEOUT_SECONDS
+        )
         return True
     except (FileNotFoundError, subprocess.TimeoutExpired):
         return False
@@ -80,170 +118,233 @@ def detect_grammar(file_path: str) -> Optional[str]:
     Returns:
         Grammar name or None if unsupported
     """
-    ext = Path(file_path).suffix.lower()
-
-    grammar_map = {
-        ".clj": "clojure",
-        ".cljs": "clojure",
-        ".cljc": "clojure",
-        ".lisp": "commonlisp",
-        ".cl": "commonlisp",
-        ".asd": "commonlisp",
-        ".el": "elisp",
-        ".rkt": "racket",  # if tree-sitter-racket available
-        ".scm": "scheme"   # generic
-    }
-
-    return grammar_map.get(ext)
+    return _GRAMMAR_MAP.get(os.path.splitext(file_path)[1].lower())
 
 
 def run_tree_sitter_parse(file_path: str) -> Dict[str, Any]:
     """
     Run tree-sitter parse and extract errors.
 
+    The parse tree is read line by line as the CLI writes it, so large trees
+    are never held in memory and error extraction overlaps with parsing.
+    Lines stay as bytes; only matched node types are decoded.
+
     Args:
         file_path: Path to source file
 
     Returns:
-        Parse result with tree and errors
+        Parse result with findings and success flag, or an error
     """
     try:
-        result = subprocess.run(
+        proc = subprocess.Popen(
             ["tree-sitter", "parse", file_path],
-            capture_output=True,
-            text=True,
-            timeout=TREE_SITTER_TIMEOUT_SECONDS
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
         )
-
-        return {
-            "output": result.stdout,
-            "success": result.returncode == 0,
-            "tree": result.stdout
-        }
-
     except FileNotFoundError:
         return {"error": "tree-sitter CLI not found (install: npm install -g tree-sitter-cli@0.19.3)"}
-    except subprocess.TimeoutExpired:
-        return {"error": "tree-sitter parse timed out"}
     except Exception as e:
         return {"error": f"tree-sitter error: {e}"}
 
+    timed_out = threading.Event()
+
+    def kill() -> None:
+        timed_out.set()
+        proc.kill()
 
-def parse_tree_sitter_output(output: str, file_path: str) -> List[Dict[str, Any]]:
+    timer = threading.Timer(TREE_SITTER_TIMEOUT_SECONDS, kill)
+    timer.start()
+
+    try:
+        with proc.stdout:
+            findings = parse_tree_sitter_lines(proc.stdout, file_path)
+        proc.wait()
+    except Exception as e:
+        proc.kill()
+        proc.wait()
+        return {"error": f"tree-sitter error: {e}"}
+    finally:
+        timer.cancel()
+
+    if timed_out.is_set():
+        return {"error": "tree-sitter parse timed out"}
+
+    return {
+        "findings": findings,
+        "success": proc.returncode == 0
+    }
+
+
+def parse_tree_sitter_lines(lines: Iterable[bytes], file_path: str) -> List[Finding]:
     """
-    Extract ERROR nodes from tree-sitter parse tree output.
+    Extract ERROR and MISSING nodes from tree-sitter parse tree lines.
 
     Tree-sitter marks unparseable sections as ERROR nodes in the parse tree.
+    ERROR findings are reported before MISSING ones, as with a whole-output
+    scan.
 
     Args:
-        output: tree-sitter parse output
+        lines: tree-sitter parse output as bytes, one line at a time
         file_path: Source file path
 
     Returns:
-        List of error dictionaries
+        List of findings
     """
     errors = []
+    missing = []
+
+    for line in lines:
+        if b"ERROR" not in line and b"MISSING" not in line:
+            continue
+
+        for match in _TS_NODE_RE.finditer(line):
+            if match.lastgroup == "error":
+                # ERROR nodes
+                errors.append(Finding(
+                    file=file_path,
+                    line=int(match.group("start_row")) + 1,  # tree-sitter uses 0-based indexing
+                    col=int(match.group("start_col")) + 1,
+                    end_line=int(match.group("end_row")) + 1,
+                    end_col=int(match.group("end_col")) + 1,
+                    severity="error",
+                    message="Parse error: unable to parse this section (possibly incomplete or malformed)",
+                    tool="tree-sitter"
+                ))
+            else:
+                # MISSING nodes (expected tokens that aren't present)
+                missing.append(Finding(
+                    file=file_path,
+                    line=int(match.group("row")) + 1,
+                    col=int(match.group("col")) + 1,
+                    severity="warning",
+                    message=f"Missing expected token: {match.group('node_type').decode('utf-8', errors='replace')}",
+                    tool="tree-sitter"
+                ))
 
-    # Pattern for ERROR nodes: ERROR [row, col] - [row, col]
-    error_pattern = r'ERROR\s+\[(\d+),\s*(\d+)\]\s*-\s*\[(\d+),\s*(\d+)\]'
-
-    for match in re.finditer(error_pattern, output):
-        start_row, start_col, end_row, end_col = match.groups()
-
-        errors.append({
-            "file": file_path,
-            "line": int(start_row) + 1,  # tree-sitter uses 0-based indexing
-            "col": int(start_col) + 1,
-            "end_line": int(end_row) + 1,
-            "end_col": int(end_col) + 1,
-            "severity": "error",
-            "message": "Parse error: unable to parse this section (possibly incomplete or malformed)",
-            "tool": "tree-sitter"
-        })
+    return errors + missing
 
-    # Also look for MISSING nodes (expected tokens that aren't present)
-    missing_pattern = r'MISSING\s+(.+?)\s+\[(\d+),\s*(\d+)\]'
 
-    for match in re.finditer(missing_pattern, output):
-        node_type, row, col = match.groups()
+def parse_tree_sitter_output(output: bytes, file_path: str) -> List[Finding]:
+    """
+    Extract ERROR nodes from tree-sitter parse tree output.
 
-        errors.append({
-            "file": file_path,
-            "line": int(row) + 1,
-            "col": int(col) + 1,
-            "severity": "warning",
-            "message": f"Missing expected token: {node_type}",
-            "tool": "tree-sitter"
-        })
+    Args:
+        output: tree-sitter parse output
+        file_path: Source file path
 
-    return errors
+    Returns:
+        List of findings
+    """
+    return parse_tree_sitter_lines(output.splitlines(), file_path)
 
 
-def validate_with_python_library(file_path: str) -> List[Dict[str, Any]]:
+def _get_language(grammar: str) -> Any:
     """
-    Fallback validation using tree-sitter Python library.
-
-    This is more reliable than CLI parsing but requires the library to be installed.
+    Load the Python binding for a grammar, reusing it across files.
 
     Args:
-        file_path: Path to source file
+        grammar: Grammar name from detect_grammar
 
     Returns:
-        List of error dictionaries
+        tree-sitter language for the grammar
+
+    Raises:
+        KeyError: If the grammar has no Python binding
+        ImportError: If the binding is not installed
     """
-    errors = []
+    lang = _TS_LANGS.get(grammar)
+    if lang is None:
+        import importlib
+        module = importlib.import_module(_PY_GRAMMAR_MODULES[grammar])
+        lang = _TS_LANGS[grammar] = module.language()
+    return lang
 
-    try:
-        from tree_sitter import Language, Parser
 
-        # Detect grammar
-        grammar = detect_grammar(file_path)
-        if not grammar:
-            return [{"error": f"Unsupported file type for tree-sitter: {file_path}"}]
+def _get_parser(grammar: str) -> Optional[Any]:
+    """
+    Get the shared tree-sitter Parser for a grammar, creating it on first use.
+
+    Args:
+        grammar: Grammar name from detect_grammar
 
-        # Try to load the language
+    Returns:
+        Parser for the grammar, or None if the library or grammar binding
+        is not installed, or this py-tree-sitter release can't load it
+    """
+    parser = _PARSERS.get(grammar)
+    if parser is None:
         try:
+            from tree_sitter import Parser
             # This requires tree-sitter-{language} to be installed
             # e.g., pip install tree-sitter-commonlisp
-            if grammar == "commonlisp":
-                from tree_sitter_commonlisp import language as commonlisp_language
-                lang = commonlisp_language()
-            elif grammar == "clojure":
-                from tree_sitter_clojure import language as clojure_language
-                lang = clojure_language()
-            elif grammar == "elisp":
-                from tree_sitter_elisp import language as elisp_language
-                lang = elisp_language()
-            else:
-                return [{"error": f"Grammar {grammar} not available in Python"}]
+            lang = _get_language(grammar)
+        except (ImportError, KeyError):
+            return None
 
+        try:
             parser = Parser()
-            parser.set_language(lang)
+            if hasattr(parser, "set_language"):
+                parser.set_language(lang)
+            else:
+                # py-tree-sitter 0.22+ replaced set_language with a property
+                parser.language = lang
+        except (AttributeError, TypeError, ValueError):
+            # An API or grammar ABI this release doesn't support: the CLI
+            # may still work
+            return None
 
-            # Read file
-            with open(file_path, 'rb') as f:
-                source_code = f.read()
+        _PARSERS[grammar] = parser
+    return parser
 
-            # Parse
-            tree = parser.parse(source_code)
 
-            # Extract errors
-            errors.extend(extract_errors_from_tree(tree.root_node, file_path, source_code))
+def validate_with_python_library(file_path: str) -> Tuple[bool, List[Finding]]:
+    """
+    Fallback validation using tree-sitter Python library.
 
-        except ImportError as e:
-            return [{"error": f"tree-sitter grammar not installed: {e}"}]
+    This is more reliable than CLI parsing but requires the library to be installed.
 
-    except ImportError:
-        return [{"error": "tree-sitter Python library not found (install: pip install tree-sitter)"}]
-    except Exception as e:
-        return [{"error": f"tree-sitter Python error: {e}"}]
+    Args:
+        file_path: Path to source file
+
+    Returns:
+        (library_available, findings) - library_available is False when the
+        library or grammar is not installed or can't be loaded, the file
+        can't be read, or the library fails to parse it, and the CLI should
+        be used instead
+    """
+    parser = _get_parser(detect_grammar(file_path))
+    if parser is None:
+        return False, []
+
+    try:
+        with open(file_path, 'rb') as f:
+            source_code = f.read()
+    except OSError:
+        return False, []
+
+    # Parse
+    try:
+        tree = parser.parse(source_code)
+    except (AttributeError, TypeError, ValueError):
+        return False, []
+
+    # Most files parse cleanly; the root's has_error flag says so without
+    # touching the tree
+    if not tree.root_node.has_error:
+        return True, []
 
-    return errors
+    # Extract errors
+    return True, extract_errors_from_tree(tree.root_node, file_path, source_code)
 
 
-def extract_errors_from_tree(node, file_path: str, source_code: bytes) -> List[Dict[str, Any]]:
+def extract_errors_from_tree(node, file_path: str, source_code: bytes) -> List[Finding]:
     """
-    Recursively extract ERROR and MISSING nodes from parse tree.
+    Extract ERROR and MISSING nodes from parse tree.
+
+    Walks the tree with a TreeCursor in document order, descending only into
+    subtrees whose has_error flag is set, so error-free code is skipped
+    without visiting its nodes (and deep nesting cannot hit the recursion
+    limit).
 
     Args:
         node: tree-sitter Node object
@@ -251,40 +352,51 @@ def extract_errors_from_tree(node, file_path: str, source_code: bytes) -> List[D
         source_code: Source code bytes
 
     Returns:
-        List of error dictionaries
+        List of findings
     """
     errors = []
 
-    if node.type == "ERROR":
-        # Get the text that failed to parse
-        error_text = source_code[node.start_byte:node.end_byte].decode('utf-8', errors='replace')
-
-        errors.append({
-            "file": file_path,
-            "line": node.start_point[0] + 1,
-            "col": node.start_point[1] + 1,
-            "end_line": node.end_point[0] + 1,
-            "end_col": node.end_point[1] + 1,
-            "severity": "error",
-            "message": f"Parse error in: {error_text[:MAX_ERROR_TEXT_LENGTH]}{'...' if len(error_text) > MAX_ERROR_TEXT_LENGTH else ''}",
-            "tool": "tree-sitter"
-        })
-
-    if node.is_missing:
-        errors.append({
-            "file": file_path,
-            "line": node.start_point[0] + 1,
-            "col": node.start_point[1] + 1,
-            "severity": "warning",
-            "message": f"Missing expected node: {node.type}",
-            "tool": "tree-sitter"
-        })
-
-    # Recursively check children
-    for child in node.children:
-        errors.extend(extract_errors_from_tree(child, file_path, source_code))
-
-    return errors
+    if not node.has_error:
+        return errors
+
+    cursor = node.walk()
+
+    while True:
+        current = cursor.node
+
+        if current.type == "ERROR":
+            # Get the text that failed to parse
+            error_text = source_code[current.start_byte:current.end_byte].decode('utf-8', errors='replace')
+
+            errors.append(Finding(
+                file=file_path,
+                line=current.start_point[0] + 1,
+                col=current.start_point[1] + 1,
+                end_line=current.end_point[0] + 1,
+                end_col=current.end_point[1] + 1,
+                severity="error",
+                message=f"Parse error in: {error_text[:MAX_ERROR_TEXT_LENGTH]}{'...' if len(error_text) > MAX_ERROR_TEXT_LENGTH else ''}",
+                tool="tree-sitter"
+            ))
+
+        if current.is_missing:
+            errors.append(Finding(
+                file=file_path,
+                line=current.start_point[0] + 1,
+                col=current.start_point[1] + 1,
+                severity="warning",
+                message=f"Missing expected node: {current.type}",
+                tool="tree-sitter"
+            ))
+
+        # Only subtrees that contain an error are worth descending into
+        if current.has_error and cursor.goto_first_child():
+            continue
+
+        # Move on to the next sibling, climbing back up as subtrees finish
+        while not cursor.goto_next_sibling():
+            if not cursor.goto_parent():
+                return errors
 
 
 def validate_tree_sitter(file_path: str, use_python: bool = True) -> Dict[str, Any]:
@@ -311,9 +423,9 @@ def validate_tree_sitter(file_path: str, use_python: bool = True) -> Dict[str, A
 
     # Try Python library first (more reliable)
     if use_python:
-        python_errors = validate_with_python_library(file_path)
+        library_available, python_errors = validate_with_python_library(file_path)
 
-        if python_errors and "error" in python_errors[0] and len(python_errors[0]) == 2:
+        if not library_available:
             # Fallback to CLI if Python library fails
             if not check_tree_sitter_available():
                 if "warnings" not in result:
@@ -328,7 +440,7 @@ def validate_tree_sitter(file_path: str, use_python: bool = True) -> Dict[str, A
                     result["warnings"] = []
                 result["warnings"].append(cli_result["error"])
             else:
-                result["findings"] = parse_tree_sitter_output(cli_result["output"], file_path)
+                result["findings"] = cli_result["findings"]
         else:
             result["findings"] = python_errors
 
@@ -347,15 +459,17 @@ def validate_tree_sitter(file_path: str, use_python: bool = True) -> Dict[str, A
                 result["warnings"] = []
             result["warnings"].append(cli_result["error"])
         else:
-            result["findings"] = parse_tree_sitter_output(cli_result["output"], file_path)
+            result["findings"] = cli_result["findings"]
 
     # Count errors and warnings
     for finding in result["findings"]:
-        if finding.get("severity") == "error":
+        if finding.severity == "error":
             result["summary"]["total_errors"] += 1
-        elif finding.get("severity") == "warning":
+        elif finding.severity == "warning":
             result["summary"]["total_warnings"] += 1
 
+    result["findings"] = [finding.to_dict() for finding in result["findings"]]
+
     return result
 
 
@@ -371,7 +485,7 @@ def main():
     result = validate_tree_sitter(file_path, use_python=use_python)
 
     # Output JSON
-    print(json.dumps(result, indent=2))
+    print(dumps_json(result))
 
     # Exit with appropriate code
     if result["summary"]["total_errors"] > 0:
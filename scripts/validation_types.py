@@ -20,15 +20,24 @@
 Shared type definitions and constants for validation scripts.
 """
 
-from typing import TypedDict, Optional, List, Literal, Dict, Any
+import json
+import os
+from pathlib import Path
+from typing import TypedDict, NamedTuple, Optional, List, Literal, Dict, Any
+
+# Optional faster JSON encoder for result output
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Type definitions
 SeverityLevel = Literal["error", "warning", "info"]
 
 
-class Finding(TypedDict, total=False):
+class FindingDict(TypedDict, total=False):
     """
-    A single validation finding (error, warning, or info).
+    A single validation finding (error, warning, or info), as reported in results.
 
     Required fields:
         file: Path to the file containing the finding
@@ -42,6 +51,7 @@ class Finding(TypedDict, total=False):
         end_line: End line number for multi-line findings
         end_col: End column number for multi-line findings
         type: Error type identifier (e.g., "unexpected-eof")
+        suggestion: Suggested fix (raco warn)
     """
     file: str
     line: int
@@ -52,6 +62,36 @@ class Finding(TypedDict, total=False):
     message: str
     type: str
     tool: str
+    suggestion: str
+
+
+# Result key order for findings, following FindingDict
+_FINDING_KEYS = ("file", "line", "col", "end_line", "end_col", "severity", "message", "type", "tool", "suggestion")
+
+
+class Finding(NamedTuple):
+    """
+    A finding while a validator is still collecting and sorting them.
+
+    Tuples are much smaller than dicts and their fields are read by index, so
+    parsers build these and convert with to_dict() when they return results.
+    Optional fields left as None are omitted from the dict.
+    """
+    file: str
+    line: int
+    col: int
+    severity: SeverityLevel
+    message: str
+    tool: str
+    end_line: Optional[int] = None
+    end_col: Optional[int] = None
+    type: Optional[str] = None
+    suggestion: Optional[str] = None
+
+    def to_dict(self) -> FindingDict:
+        """Convert to a result dict in the usual key order."""
+        fields = self._asdict()
+        return {key: fields[key] for key in _FINDING_KEYS if fields[key] is not None}
 
 
 class ValidationSummary(TypedDict):
@@ -86,7 +126,7 @@ class ValidationResult(TypedDict, total=False):
     target: str
     dialect: str
     detected_dialect: str
-    findings: List[Finding]
+    findings: List[FindingDict]
     summary: ValidationSummary
     warnings: List[str]
     error: str
@@ -98,11 +138,12 @@ CLJ_KONDO_TIMEOUT_SECONDS = 30
 JOKER_TIMEOUT_SECONDS = 10
 TREE_SITTER_TIMEOUT_SECONDS = 30
 RACO_TIMEOUT_SECONDS = 30
-SBLINT_TIMEOUT_SECONDS = 30
+SBLINT_TIMEOUT_SECONDS = 60  # SBLint loads SBCL and the target's system before linting
 SBCL_TIMEOUT_SECONDS = 60
-TOOL_CHECK_TIMEOUT_SECONDS = 5
+TOOL_CHECK_TIMEOUT_SECONDS = 5  # JVM-backed tools can be slow to answer --version when cold
 MAX_ERROR_TEXT_LENGTH = 50  # Maximum length of error text in messages
 MAX_SBCL_MESSAGE_LENGTH = 500  # Maximum length of SBCL error messages
+CACHE_DIR_ENV = "LISP_VALIDATOR_CACHE"  # Overrides the persistent cache directory
 
 # Exit codes
 EXIT_SUCCESS = 0  # No issues found
@@ -126,6 +167,41 @@ DIALECT_UNKNOWN = "unknown"
 
 
 # Helper functions
+def get_cache_dir() -> Path:
+    """
+    Get the directory for persistent caches (not created here).
+
+    Uses $LISP_VALIDATOR_CACHE if set, otherwise $XDG_CACHE_HOME/lisp-validator,
+    falling back to ~/.cache/lisp-validator.
+
+    Returns:
+        Cache directory path
+    """
+    override = os.environ.get(CACHE_DIR_ENV)
+    if override:
+        return Path(override).expanduser()
+
+    base = os.environ.get("XDG_CACHE_HOME") or "~/.cache"
+    return Path(base).expanduser() / "lisp-validator"
+
+
+def dumps_json(data: Any) -> str:
+    """
+    Serialize a validation result as 2-space indented JSON.
+
+    Uses orjson when it is installed, falling back to the standard library.
+
+    Args:
+        data: JSON-serializable result
+
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(data, indent=2)
+
+
 def create_tool_not_found_error(tool_name: str, install_cmd: Optional[str] = None) -> Dict[str, str]:
     """
     Create a standardized tool-not-found error message.
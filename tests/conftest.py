@@ -0,0 +1,79 @@
+#
+# Lisp Validator - Multi-dialect Lisp code validation tool
+# Copyright (C) 2025  Tom Waddington
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Shared pytest fixtures.
+
+The scripts are not a package, so their directory is put on sys.path and
+they are imported by module name, as they import each other.
+"""
+
+import os
+import stat
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import tool_registry  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Point the persistent caches at a per-test directory."""
+    directory = tmp_path / "cache"
+    monkeypatch.setenv("LISP_VALIDATOR_CACHE", str(directory))
+    return directory
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry():
+    """Forget the per-process tool probes around each test."""
+    def clear():
+        tool_registry._check_command_cached.cache_clear()
+        tool_registry.find_tool.cache_clear()
+        tool_registry.get_tool_version.cache_clear()
+        tool_registry.get_tool_status.cache_clear()
+
+    clear()
+    yield
+    clear()
+
+
+@pytest.fixture
+def tool_bin(tmp_path, monkeypatch):
+    """
+    A PATH holding only fake tools (plus the system shell utilities).
+
+    Returns a function that writes a fake tool from a shell script body.
+    Writes to an existing tool rewrite it in place, which (like a real
+    in-place upgrade) leaves the directory's mtime alone.
+    """
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    monkeypatch.setenv("PATH", os.pathsep.join([str(bin_dir), "/usr/bin", "/bin"]))
+
+    def make_tool(name: str, body: str) -> Path:
+        path = bin_dir / name
+        with open(path, "w") as f:
+            f.write("#!/bin/sh\n" + body + "\n")
+        path.chmod(path.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+        return path
+
+    return make_tool
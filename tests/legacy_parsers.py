@@ -0,0 +1,240 @@
+#
+# Lisp Validator - Multi-dialect Lisp code validation tool
+# Copyright (C) 2025  Tom Waddington
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Reference copies of the original str-based parsers.
+
+The validators now parse with precompiled, bytes or whole-output regexes;
+these line-by-line versions are what they replaced, and the parity tests
+check that both read the same input the same way.
+"""
+
+import re
+from typing import Any, Dict, List, Optional
+
+from validation_types import MAX_ERROR_TEXT_LENGTH
+
+
+def detect_dialect_from_content(content: str) -> Optional[str]:
+    """Original validate.detect_dialect_from_content."""
+    if re.search(r'^\s*\(ns\s+', content, re.MULTILINE):
+        return "clojure"
+
+    if re.search(r'\[.*:as\s+', content) or '::' in content:
+        return "clojure"
+
+    if re.search(r'^\s*#lang\s+racket', content, re.MULTILINE):
+        return "racket"
+
+    if re.search(r'^\s*\(module\s+', content, re.MULTILINE):
+        return "racket"
+
+    if re.search(r'^\s*\(defpackage\s+', content, re.MULTILINE):
+        return "common-lisp"
+
+    if re.search(r'^\s*\(in-package\s+', content, re.MULTILINE):
+        return "common-lisp"
+
+    if re.search(r'^\s*\(defsystem\s+', content, re.MULTILINE):
+        return "common-lisp"
+
+    if re.search(r'^\s*\(define-module\s+', content, re.MULTILINE):
+        return "scheme"
+
+    return None
+
+
+def parse_joker_output(output: str) -> List[Dict[str, Any]]:
+    """Original validate_clojure.parse_joker_output."""
+    errors = []
+    pattern = r'(.+?):(\d+):(\d+):\s*(.+?):\s*(.+)'
+
+    for line in output.strip().split('\n'):
+        if not line:
+            continue
+
+        match = re.match(pattern, line)
+        if match:
+            filename, line_num, col, issue_type, message = match.groups()
+
+            severity = "error" if "error" in issue_type.lower() else "warning"
+
+            errors.append({
+                "file": filename,
+                "line": int(line_num),
+                "col": int(col),
+                "severity": severity,
+                "message": message.strip(),
+                "type": issue_type.strip(),
+                "tool": "joker"
+            })
+
+    return errors
+
+
+def parse_raco_errors(output: str, filename: str, tool: str) -> List[Dict[str, Any]]:
+    """Original validate_scheme.parse_raco_errors."""
+    errors = []
+    pattern = r'(.+?):(\d+):(\d+):\s*(.+)'
+
+    for line in output.strip().split('\n'):
+        if not line:
+            continue
+
+        match = re.match(pattern, line)
+        if match:
+            file, line_num, col, message = match.groups()
+            errors.append({
+                "file": file,
+                "line": int(line_num),
+                "col": int(col),
+                "severity": "error",
+                "message": message.strip(),
+                "tool": tool
+            })
+        elif "error" in line.lower() or "unbound" in line.lower():
+            errors.append({
+                "file": filename,
+                "line": 0,
+                "col": 0,
+                "severity": "error",
+                "message": line.strip(),
+                "tool": tool
+            })
+
+    return errors
+
+
+def parse_raco_structured_output(output: str, tool: str) -> List[Dict[str, Any]]:
+    """Original validate_scheme.parse_raco_structured_output."""
+    errors = []
+    pattern = r'(.+?):(\d+):(\d+):(error|warning|info):\s*(.+)'
+
+    for line in output.strip().split('\n'):
+        if not line:
+            continue
+
+        match = re.match(pattern, line)
+        if match:
+            file, line_num, col, level, message = match.groups()
+            errors.append({
+                "file": file,
+                "line": int(line_num),
+                "col": int(col),
+                "severity": level,
+                "message": message.strip(),
+                "tool": tool
+            })
+
+    return errors
+
+
+def parse_raco_warn_output(output: str, tool: str) -> List[Dict[str, Any]]:
+    """Original validate_scheme.parse_raco_warn_output."""
+    errors = []
+    pattern = r'(.+?):(\d+):(\d+):(warning|error|info):\s*(.+?)(?:\s+suggestion:\s*(.+))?$'
+
+    for line in output.strip().split('\n'):
+        if not line:
+            continue
+
+        match = re.match(pattern, line)
+        if match:
+            file, line_num, col, level, message, suggestion = match.groups()
+
+            error_dict = {
+                "file": file,
+                "line": int(line_num),
+                "col": int(col),
+                "severity": level,
+                "message": message.strip(),
+                "tool": tool
+            }
+
+            if suggestion:
+                error_dict["suggestion"] = suggestion.strip()
+
+            errors.append(error_dict)
+
+    return errors
+
+
+def parse_tree_sitter_output(output: str, file_path: str) -> List[Dict[str, Any]]:
+    """Original validate_tree_sitter.parse_tree_sitter_output."""
+    errors = []
+
+    for match in re.finditer(r'ERROR\s+\[(\d+),\s*(\d+)\]\s*-\s*\[(\d+),\s*(\d+)\]', output):
+        start_row, start_col, end_row, end_col = match.groups()
+
+        errors.append({
+            "file": file_path,
+            "line": int(start_row) + 1,
+            "col": int(start_col) + 1,
+            "end_line": int(end_row) + 1,
+            "end_col": int(end_col) + 1,
+            "severity": "error",
+            "message": "Parse error: unable to parse this section (possibly incomplete or malformed)",
+            "tool": "tree-sitter"
+        })
+
+    for match in re.finditer(r'MISSING\s+(.+?)\s+\[(\d+),\s*(\d+)\]', output):
+        node_type, row, col = match.groups()
+
+        errors.append({
+            "file": file_path,
+            "line": int(row) + 1,
+            "col": int(col) + 1,
+            "severity": "warning",
+            "message": f"Missing expected token: {node_type}",
+            "tool": "tree-sitter"
+        })
+
+    return errors
+
+
+def extract_errors_from_tree(node, file_path: str, source_code: bytes) -> List[Dict[str, Any]]:
+    """Original validate_tree_sitter.extract_errors_from_tree (recursive walk)."""
+    errors = []
+
+    if node.type == "ERROR":
+        error_text = source_code[node.start_byte:node.end_byte].decode('utf-8', errors='replace')
+
+        errors.append({
+            "file": file_path,
+            "line": node.start_point[0] + 1,
+            "col": node.start_point[1] + 1,
+            "end_line": node.end_point[0] + 1,
+            "end_col": node.end_point[1] + 1,
+            "severity": "error",
+            "message": f"Parse error in: {error_text[:MAX_ERROR_TEXT_LENGTH]}{'...' if len(error_text) > MAX_ERROR_TEXT_LENGTH else ''}",
+            "tool": "tree-sitter"
+        })
+
+    if node.is_missing:
+        errors.append({
+            "file": file_path,
+            "line": node.start_point[0] + 1,
+            "col": node.start_point[1] + 1,
+            "severity": "warning",
+            "message": f"Missing expected node: {node.type}",
+            "tool": "tree-sitter"
+        })
+
+    for child in node.children:
+        errors.extend(extract_errors_from_tree(child, file_path, source_code))
+
+    return errors
@@ -0,0 +1,70 @@
+#
+# Lisp Validator - Multi-dialect Lisp code validation tool
+# Copyright (C) 2025  Tom Waddington
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Tests for running joker over directory targets."""
+
+import pytest
+
+import validate_clojure
+
+FAKE_JOKER = "\n".join([
+    '# joker --lint --dialect clj FILE',
+    'case "$4" in',
+    '  *slow*) exec sleep 5 ;;',
+    '  *) echo "$4:1:2: Parse warning: unused binding x" >&2 ;;',
+    'esac',
+])
+
+
+@pytest.fixture
+def sources(tmp_path):
+    root = tmp_path / "src"
+    (root / "nested").mkdir(parents=True)
+    for name in ("a.clj", "nested/b.cljs", "c.cljc", "notes.txt"):
+        (root / name).write_text("(ns x)\n")
+    return root
+
+
+def test_run_joker_lints_each_file_in_walk_order(sources, tool_bin):
+    tool_bin("joker", FAKE_JOKER)
+
+    errors = validate_clojure.run_joker(str(sources))
+
+    files = list(validate_clojure._iter_clj_files(str(sources)))
+    assert sorted(files) == sorted(str(sources / name) for name in ("a.clj", "nested/b.cljs", "c.cljc"))
+    assert [error["file"] for error in errors] == files
+    assert all(error["severity"] == "warning" and error["line"] == 1 and error["col"] == 2 for error in errors)
+
+
+def test_run_joker_timeout_is_reported_per_file(sources, tool_bin, monkeypatch):
+    monkeypatch.setattr(validate_clojure, "JOKER_TIMEOUT_SECONDS", 0.3)
+    tool_bin("joker", FAKE_JOKER)
+    slow = sources / "slow.clj"
+    slow.write_text("(ns slow)\n")
+
+    errors = validate_clojure.run_joker(str(sources))
+
+    timeouts = [error for error in errors if "error" in error]
+    assert timeouts == [{"error": "joker timed out", "file": str(slow), "tool": "joker"}]
+    # The other files' findings survive the slow one
+    assert len(errors) == 4
+
+
+def test_run_joker_missing_tool(sources, tool_bin):
+    assert validate_clojure.run_joker(str(sources)) == [
+        {"error": "joker not found", "error_kind": "not_found", "file": str(sources), "tool": "joker"}
+    ]
@@ -0,0 +1,77 @@
+#
+# Lisp Validator - Multi-dialect Lisp code validation tool
+# Copyright (C) 2025  Tom Waddington
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Tests for the Common Lisp validator's SBLint run and CLI options."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import validate_common_lisp
+
+SCRIPT = Path(__file__).resolve().parent.parent / "scripts" / "validate_common_lisp.py"
+
+
+def _run_cli(*args):
+    return subprocess.run([sys.executable, str(SCRIPT), *args], capture_output=True, text=True, timeout=60)
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "app.lisp"
+    path.write_text("(defpackage :app (:use :cl))\n")
+    return path
+
+
+def test_run_sblint_uses_the_shared_timeout(tool_bin, source, monkeypatch):
+    monkeypatch.setattr(validate_common_lisp, "SBLINT_TIMEOUT_SECONDS", 0.2)
+    tool_bin("sblint", "exec sleep 5")
+
+    run = validate_common_lisp.run_sblint(str(source))
+
+    assert run == {
+        "tool_errors": [{"error": "sblint timed out", "file": str(source), "tool": "sblint"}],
+        "findings": []
+    }
+
+
+@pytest.mark.parametrize("value", ["0", "-5", "nan", "inf", "soon"])
+def test_sbcl_timeout_rejects_unusable_values(source, value):
+    run = _run_cli(str(source), "--sbcl-timeout", value)
+
+    assert run.returncode == 1
+    assert f"Invalid --sbcl-timeout value: {value}" in run.stderr
+    assert run.stdout == ""
+
+
+def test_sbcl_timeout_requires_a_value(source):
+    run = _run_cli(str(source), "--sbcl-timeout")
+
+    assert run.returncode == 1
+    assert "--sbcl-timeout requires a value" in run.stderr
+    assert run.stdout == ""
+
+
+def test_sbcl_timeout_accepts_positive_seconds(tool_bin, source):
+    # No Lisp tools on PATH: validation runs and reports them missing
+    run = _run_cli(str(source), "--no-sbcl", "--sbcl-timeout", "0.5")
+
+    assert run.returncode != 1
+    assert json.loads(run.stdout)["target"] == str(source)
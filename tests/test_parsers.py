@@ -0,0 +1,134 @@
+#
+# Lisp Validator - Multi-dialect Lisp code validation tool
+# Copyright (C) 2025  Tom Waddington
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Parity tests: the bytes/precompiled parsers against the originals."""
+
+import random
+
+import pytest
+
+import legacy_parsers
+import validate
+import validate_clojure
+import validate_tree_sitter
+
+DIALECT_SAMPLES = [
+    "",
+    "(ns my.app\n  (:require [clojure.string :as str]))\n",
+    "  (ns\tindented)\n",
+    "(nsfoo)\n",
+    "(require '[clojure.set :as set])\n",
+    "{:a ::keyword}\n",
+    "#lang racket\n(define x 1)\n",
+    "#lang racket/base\n",
+    "#lang scheme\n",
+    "(module m racket\n  (provide x))\n",
+    "(modules)\n",
+    "(defpackage :my-app\n  (:use :cl))\n(in-package :my-app)\n",
+    "(in-package #:cl-user)\n",
+    "(defsystem \"app\" :depends-on (:alexandria))\n",
+    "(define-module (my module))\n",
+    "(define-module-x)\n",
+    "(define-module (m))\n(ns late)\n",
+    "(defpackage :p)\n#lang racket\n",
+    "; (ns commented)\n",
+    "(foo (ns inner))\n",
+    "(define (f x) x)\n",
+    "(ns\n",
+    "(ns",
+    "[x :as]",
+    "[x :as y]",
+]
+
+_FRAGMENTS = ["(ns", "(module", "(defpackage", "(in-package", "(defsystem", "(define-module",
+              "#lang", "racket", "scheme", "[", "]", ":as", "::", ":", "(", ")", "x", "ns",
+              " ", "  ", "\t", "\n", "\r\n", "\f", "\v", ";"]
+
+
+def _random_texts(fragments, count, seed):
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield "".join(rng.choice(fragments) for _ in range(rng.randint(0, 12)))
+
+
+@pytest.mark.parametrize("content", DIALECT_SAMPLES)
+def test_detect_dialect_from_content_matches_original(content):
+    expected = legacy_parsers.detect_dialect_from_content(content)
+    assert validate.detect_dialect_from_content(content) == expected
+    assert validate.detect_dialect_from_content(content.encode("utf-8")) == expected
+
+
+def test_detect_dialect_from_content_matches_original_on_random_input():
+    for content in _random_texts(_FRAGMENTS, 5000, seed=1):
+        assert validate.detect_dialect_from_content(content.encode("utf-8")) == \
+            legacy_parsers.detect_dialect_from_content(content), repr(content)
+
+
+JOKER_OUTPUT = (
+    "src/app/core.clj:3:1: Parse warning: unused binding x\n"
+    "src/app/core.clj:10:15: Parse error: Unable to resolve symbol: foo\n"
+    "src/app/core.clj:12:4: Warning: unused namespace clojure.string\r\n"
+    "\n"
+    "not a finding\n"
+    "C:\\src\\app.clj:1:1: Read error: EOF while reading\n"
+    "src/app/ünïcode.clj:2:2: Parse warning: naïve message  \n"
+    "x:1:1:warning:no: space\n"
+    "x:1:1: Parse Error:\n"
+)
+
+_JOKER_FRAGMENTS = ["src/a.clj", ":", "1", "23", " ", "error", "Error", "warning", "Parse ",
+                    "msg", "\t", "\n", "\r\n", "é"]
+
+
+def test_parse_joker_output_matches_original():
+    expected = legacy_parsers.parse_joker_output(JOKER_OUTPUT)
+    assert expected  # the corpus exercises real findings
+    assert validate_clojure.parse_joker_output(JOKER_OUTPUT.encode("utf-8")) == expected
+
+
+def test_parse_joker_line_matches_original_on_streamed_lines():
+    for output in [JOKER_OUTPUT, *_random_texts(_JOKER_FRAGMENTS, 3000, seed=2)]:
+        # Streaming from a pipe yields lines with their newlines attached
+        lines = output.encode("utf-8").splitlines(keepends=True)
+        streamed = [error for error in map(validate_clojure.parse_joker_line, lines) if error]
+        assert streamed == legacy_parsers.parse_joker_output(output), repr(output)
+
+
+TREE_SITTER_OUTPUT = b"""\
+(source [0, 0] - [3, 0]
+  (list_lit [0, 0] - [1, 10]
+    (sym_lit [0, 1] - [0, 4]
+      name: (sym_name [0, 1] - [0, 4]))
+    (ERROR [0, 5] - [1, 2]
+      (num_lit [0, 6] - [0, 7]))
+    (MISSING ")" [1, 10] - [1, 10]))
+  (ERROR [2, 0] - [2, 8]
+    (MISSING sym_name [2, 3] - [2, 3])))
+x.clj\tParse:    0.05 ms\t  1024 bytes/ms\t(ERROR [0, 5] - [1, 2])
+"""
+
+
+def test_parse_tree_sitter_output_matches_original():
+    expected = legacy_parsers.parse_tree_sitter_output(TREE_SITTER_OUTPUT.decode("utf-8"), "x.clj")
+    findings = validate_tree_sitter.parse_tree_sitter_output(TREE_SITTER_OUTPUT, "x.clj")
+    assert len(expected) == 5
+    assert [finding.to_dict() for finding in findings] == expected
+
+
+def test_parse_tree_sitter_lines_clean_tree_has_no_findings():
+    output = b"(source [0, 0] - [1, 0]\n  (list_lit [0, 0] - [0, 2]))\n"
+    assert validate_tree_sitter.parse_tree_sitter_lines(output.splitlines(keepends=True), "x.clj") == []
@@ -0,0 +1,153 @@
+#
+# Lisp Validator - Multi-dialect Lisp code validation tool
+# Copyright (C) 2025  Tom Waddington
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Tests for the per-file result cache and its key."""
+
+import os
+
+import pytest
+
+import result_cache
+import tool_registry
+import validate_clojure
+
+KONDO_OUTPUT = '{"findings": [], "summary": {"error": 0, "warning": 0, "info": 0}}'
+
+
+def _kondo_script(log):
+    """A fake clj-kondo that logs each lint run (not version probes)."""
+    return (
+        'if [ "$1" = --version ]; then echo "clj-kondo v2024.01.01"; exit 0; fi\n'
+        f"echo lint >> '{log}'\n"
+        f"echo '{KONDO_OUTPUT}'"
+    )
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch, tool_bin):
+    """A Clojure source file in an isolated project and config home."""
+    root = tmp_path / "project"
+    root.mkdir()
+    monkeypatch.chdir(root)
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "config"))
+
+    source = root / "core.clj"
+    source.write_text("(ns core)\n(defn f [x] x)\n")
+
+    log = tmp_path / "calls.log"
+    kondo = tool_bin("clj-kondo", _kondo_script(log))
+    return {"root": root, "source": source, "log": log, "kondo": kondo, "tool_bin": tool_bin}
+
+
+def _key(source, options=None):
+    target = str(source)
+    return result_cache.result_cache_key(target, options or {"dialect": "clojure"}, ("clj-kondo",),
+                                         config_files=validate_clojure._linter_config_files(target))
+
+
+def _lint_runs(log):
+    return len(log.read_text().splitlines()) if log.exists() else 0
+
+
+def test_key_is_stable_when_nothing_changed(project):
+    assert _key(project["source"]) == _key(project["source"])
+
+
+def test_key_changes_with_content(project):
+    before = _key(project["source"])
+    project["source"].write_text("(ns core)\n(defn g [x] x)\n")
+    assert _key(project["source"]) != before
+
+
+def test_key_changes_with_options(project):
+    assert _key(project["source"], {"dialect": "clojure", "use_joker": True}) != \
+        _key(project["source"], {"dialect": "clojure", "use_joker": False})
+
+
+def test_key_changes_with_linter_config(project):
+    before = _key(project["source"])
+
+    kondo_dir = project["root"] / ".clj-kondo"
+    kondo_dir.mkdir()
+    created = _key(project["source"])
+    (kondo_dir / "config.edn").write_text("{:linters {:unused-binding {:level :off}}}\n")
+    written = _key(project["source"])
+    (kondo_dir / "config.edn").write_text("{:linters {:unused-binding {:level :error}}}\n")
+    edited = _key(project["source"])
+
+    assert len({before, created, written, edited}) == 4
+
+
+def test_key_changes_with_joker_config(project):
+    before = _key(project["source"])
+    (project["root"] / ".joker").write_text("{:known-macros [my/defthing]}\n")
+    assert _key(project["source"]) != before
+
+
+def test_key_changes_when_tool_binary_is_replaced_in_place(project):
+    before = _key(project["source"])
+    fingerprint = tool_registry.path_fingerprint()
+
+    # Same path, same $PATH fingerprint, same cached version: only the
+    # binary itself differs
+    project["tool_bin"]("clj-kondo", _kondo_script(project["log"]) + "\n# upgraded")
+    assert tool_registry.path_fingerprint() == fingerprint
+
+    assert _key(project["source"]) != before
+
+
+def test_key_changes_with_tool_mtime(project):
+    before = _key(project["source"])
+    stat = project["kondo"].stat()
+    os.utime(project["kondo"], ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert _key(project["source"]) != before
+
+
+def test_key_for_missing_target_is_none(tmp_path):
+    assert result_cache.result_cache_key(str(tmp_path / "missing.clj"), {}, ()) is None
+
+
+def test_store_and_load_round_trip():
+    result = {"target": "core.clj", "findings": [], "summary": {"total_errors": 0}}
+    result_cache.store_cached_result("abc", result)
+    assert result_cache.load_cached_result("abc") == result
+    assert result_cache.load_cached_result("def") is None
+
+
+def test_results_with_warnings_are_not_stored():
+    result_cache.store_cached_result("abc", {"findings": [], "warnings": ["joker timed out"]})
+    assert result_cache.load_cached_result("abc") is None
+
+
+def test_validate_clojure_does_not_cache_by_default(project):
+    target = str(project["source"])
+    validate_clojure.validate_clojure(target, use_joker=False)
+    validate_clojure.validate_clojure(target, use_joker=False)
+    assert _lint_runs(project["log"]) == 2
+
+
+def test_validate_clojure_reuses_cached_result_when_enabled(project):
+    target = str(project["source"])
+    first = validate_clojure.validate_clojure(target, use_joker=False, use_cache=True)
+    second = validate_clojure.validate_clojure(target, use_joker=False, use_cache=True)
+    assert second == first
+    assert _lint_runs(project["log"]) == 1
+
+    # A config edit invalidates it
+    (project["root"] / ".joker").write_text("{}\n")
+    validate_clojure.validate_clojure(target, use_joker=False, use_cache=True)
+    assert _lint_runs(project["log"]) == 2
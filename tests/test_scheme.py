@@ -0,0 +1,180 @@
+#
+# Lisp Validator - Multi-dialect Lisp code validation tool
+# Copyright (C) 2025  Tom Waddington
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Tests for raco output parsing and batched finding routing."""
+
+import json
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import legacy_parsers
+import validate_scheme
+from validation_types import Finding
+
+RACO_OUTPUT = (
+    "a.rkt:3:5:warning: unused variable x\n"
+    "a.rkt:4:1:error:  unbound identifier in module\n"
+    "  b.rkt:10:2:info: style: prefer define\r\n"
+    "\n"
+    "b.rkt:1:1:warning: shadowed binding suggestion: rename it\n"
+    "b.rkt:2:2:warning: trailing suggestion:   \n"
+    "b.rkt:x:1:warning: bad line number\n"
+    "c:/dir/c.rkt:7:8:error: drive letter path\n"
+    "c.rkt:1:1:notice: unknown level\n"
+    "c.rkt:1:1:error:\n"
+    "expand: unbound identifier\n"
+    "ERROR in module\n"
+    "read-syntax: expected a `)`\n"
+    "a.rkt:1:2: message with: colons\n"
+)
+
+_RACO_FRAGMENTS = ["a.rkt", ":", "1", "42", "error", "warning", "info", "unbound", "ERROR",
+                   " ", "  ", "msg", "suggestion:", "\t", "\n", "\r\n", "é"]
+
+
+def _corpus():
+    rng = random.Random(3)
+    yield RACO_OUTPUT
+    for _ in range(3000):
+        yield "".join(rng.choice(_RACO_FRAGMENTS) for _ in range(rng.randint(0, 14)))
+
+
+def _dicts(findings):
+    return [finding.to_dict() for finding in findings]
+
+
+def test_parse_raco_errors_matches_original():
+    for output in _corpus():
+        assert _dicts(validate_scheme.parse_raco_errors(output, "a.rkt", "raco-expand")) == \
+            legacy_parsers.parse_raco_errors(output, "a.rkt", "raco-expand"), repr(output)
+
+
+def test_parse_raco_structured_output_matches_original():
+    for output in _corpus():
+        assert _dicts(validate_scheme.parse_raco_structured_output(output, "raco-review")) == \
+            legacy_parsers.parse_raco_structured_output(output, "raco-review"), repr(output)
+
+
+def test_parse_raco_warn_output_matches_original():
+    for output in _corpus():
+        assert _dicts(validate_scheme.parse_raco_warn_output(output, "raco-warn")) == \
+            legacy_parsers.parse_raco_warn_output(output, "raco-warn"), repr(output)
+
+
+def _finding(file):
+    return Finding(file=file, line=1, col=1, severity="warning", message="m", tool="raco-review")
+
+
+@pytest.fixture
+def tree(tmp_path):
+    """Two target directories and a file outside both."""
+    (tmp_path / "app" / "sub").mkdir(parents=True)
+    (tmp_path / "lib").mkdir()
+    (tmp_path / "other").mkdir()
+    for name in ("app/main.rkt", "app/sub/util.rkt", "lib/lib.rkt", "other/dep.rkt"):
+        (tmp_path / name).write_text("#lang racket\n")
+    return tmp_path
+
+
+def test_route_findings_single_target_takes_everything(tree):
+    findings = [_finding(str(tree / "other" / "dep.rkt")), _finding("elsewhere.rkt")]
+    assert validate_scheme._route_findings(findings, [str(tree / "app")]) == ({str(tree / "app"): findings}, [])
+
+
+def test_route_findings_by_file_and_directory(tree):
+    app, lib_file = str(tree / "app"), str(tree / "lib" / "lib.rkt")
+    main, util = _finding(str(tree / "app" / "main.rkt")), _finding(str(tree / "app" / "sub" / "util.rkt"))
+    lib = _finding(lib_file)
+
+    routed = validate_scheme._route_findings([main, lib, util], [app, lib_file])
+
+    assert routed == ({app: [main, util], lib_file: [lib]}, [])
+
+
+def test_route_findings_does_not_match_a_sibling_prefix(tree):
+    (tree / "application").mkdir()
+    stray = _finding(str(tree / "application" / "x.rkt"))
+    app, application = str(tree / "app"), str(tree / "application")
+
+    routed = validate_scheme._route_findings([stray], [app, application])
+
+    assert routed == ({app: [], application: [stray]}, [])
+
+
+def test_route_findings_keeps_unmatched_findings_apart(tree):
+    app, sub, lib = str(tree / "app" / "main.rkt"), str(tree / "app" / "sub"), str(tree / "lib")
+    util = _finding(str(tree / "app" / "sub" / "util.rkt"))
+    sibling = _finding(str(tree / "app" / "dep.rkt"))
+    outside = _finding(str(tree / "other" / "dep.rkt"))
+
+    routed, unmatched = validate_scheme._route_findings([sibling, util, outside], [lib, app, sub])
+
+    # Every target keeps its key, and none is charged for a file it doesn't contain
+    assert routed == {lib: [], app: [], sub: [util]}
+    assert unmatched == [sibling, outside]
+
+
+def test_route_findings_relative_and_absolute_spellings(tree, monkeypatch):
+    monkeypatch.chdir(tree)
+    main = _finding(str(tree / "app" / "main.rkt"))
+    lib = _finding("lib/lib.rkt")
+
+    routed = validate_scheme._route_findings([main, lib], ["app", str(tree / "lib")])
+
+    assert routed == ({"app": [main], str(tree / "lib"): [lib]}, [])
+
+
+def test_validate_scheme_batch_routes_raco_findings(tree, tool_bin, monkeypatch):
+    validate_scheme.check_raco_available.cache_clear()
+    monkeypatch.chdir(tree)
+    tool_bin("raco", "\n".join([
+        'case "$1" in',
+        '  review) echo "app/main.rkt:2:1:warning: unused x"; echo "lib/lib.rkt:3:4:error: bad form" ;;',
+        '  warn) echo "other/dep.rkt:1:1:warning: from a dependency suggestion: ignore" ;;',
+        'esac',
+    ]))
+
+    try:
+        results, unmatched = validate_scheme.validate_scheme_batch(["app", "lib"])
+    finally:
+        validate_scheme.check_raco_available.cache_clear()
+
+    assert set(results) == {"app", "lib"}
+    assert [(f["file"], f["tool"]) for f in results["app"]["findings"]] == [("app/main.rkt", "raco-review")]
+    assert results["app"]["summary"]["total_warnings"] == 1
+    assert [(f["file"], f["severity"]) for f in results["lib"]["findings"]] == [("lib/lib.rkt", "error")]
+    assert results["lib"]["summary"]["tools_used"] == ["raco-expand", "raco-review", "raco-warn"]
+    assert unmatched == [{
+        "file": "other/dep.rkt", "line": 1, "col": 1, "severity": "warning",
+        "message": "from a dependency", "tool": "raco-warn", "suggestion": "ignore"
+    }]
+
+
+def test_cli_reports_unmatched_findings_without_counting_them(tree, tool_bin, monkeypatch):
+    monkeypatch.chdir(tree)
+    tool_bin("raco", 'if [ "$1" = warn ]; then echo "other/dep.rkt:1:1:error: from a dependency"; fi')
+    script = Path(__file__).resolve().parent.parent / "scripts" / "validate_scheme.py"
+
+    run = subprocess.run([sys.executable, str(script), "app", "lib"], capture_output=True, text=True, timeout=60)
+
+    assert run.returncode == 0
+    assert all(result["findings"] == [] for result in json.loads(run.stdout))
+    assert "raco-warn reported other/dep.rkt:1:1, outside every target: from a dependency" in run.stderr
@@ -0,0 +1,144 @@
+#
+# Lisp Validator - Multi-dialect Lisp code validation tool
+# Copyright (C) 2025  Tom Waddington
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Tests for tool probing and the on-disk probe cache."""
+
+import json
+import os
+
+import tool_registry
+
+
+def _cached_probes(cache_dir):
+    with open(cache_dir / tool_registry.TOOL_CACHE_FILENAME, encoding="utf-8") as f:
+        (probes,) = json.load(f).values()
+    return probes
+
+
+def _new_process():
+    """Forget the in-process probes, as a fresh run would."""
+    tool_registry._check_command_cached.cache_clear()
+    tool_registry.find_tool.cache_clear()
+    tool_registry.get_tool_version.cache_clear()
+
+
+def test_slow_probe_reports_unknown_version(tool_bin, monkeypatch):
+    monkeypatch.setattr(tool_registry, "TOOL_CHECK_TIMEOUT_SECONDS", 0.2)
+    tool_bin("joker", "exec sleep 5")
+
+    status = tool_registry.check_tools()
+
+    assert status["joker"]["available"] is True
+    assert status["joker"]["version"] is None
+    assert "did not answer --version" in status["joker"]["warning"]
+
+
+def test_check_command_after_timeout(tool_bin, monkeypatch):
+    monkeypatch.setattr(tool_registry, "TOOL_CHECK_TIMEOUT_SECONDS", 0.2)
+    tool_bin("joker", "exec sleep 5")
+
+    # Found on PATH but too slow: installed, version unknown
+    assert tool_registry.check_command("joker") == (True, None)
+
+def test_timed_out_probe_is_not_cached(tool_bin, cache_dir, monkeypatch):
+    monkeypatch.setattr(tool_registry, "TOOL_CHECK_TIMEOUT_SECONDS", 0.2)
+    tool_bin("joker", "exec sleep 5")
+
+    tool_registry.check_tools()
+
+    probes = _cached_probes(cache_dir)
+    assert "joker" not in probes
+    assert probes["sbcl"] == [False, None]
+
+
+def test_timed_out_probe_is_retried_next_run(tool_bin, monkeypatch):
+    monkeypatch.setattr(tool_registry, "TOOL_CHECK_TIMEOUT_SECONDS", 0.2)
+    tool_bin("joker", "exec sleep 5")
+    tool_registry.check_tools()
+    fingerprint = tool_registry.path_fingerprint()
+
+    # The tool answers in time on the next run; $PATH looks the same
+    tool_bin("joker", "echo 'joker v1.0'")
+    assert tool_registry.path_fingerprint() == fingerprint
+    _new_process()
+
+    status = tool_registry.check_tools()
+
+    assert status["joker"]["version"] == "joker v1.0"
+    assert "warning" not in status["joker"]
+
+
+def test_cached_negative_is_reprobed_once_on_path(tool_bin, tmp_path, cache_dir):
+    assert tool_registry.check_tools()["joker"]["available"] is False
+    assert _cached_probes(cache_dir)["joker"] == [False, None]
+
+    # Install joker without touching the directory's mtime, so the
+    # fingerprint still matches the cached negative
+    bin_dir = tmp_path / "bin"
+    before = bin_dir.stat()
+    tool_bin("joker", "echo 'joker v1.0'")
+    os.utime(bin_dir, ns=(before.st_atime_ns, before.st_mtime_ns))
+    _new_process()
+
+    status = tool_registry.check_tools()
+
+    assert status["joker"]["available"] is True
+    assert status["joker"]["version"] == "joker v1.0"
+
+
+def test_definite_probes_are_served_from_disk(tool_bin, tmp_path):
+    log = tmp_path / "calls.log"
+    tool_bin("joker", f"echo joker >> '{log}'\necho 'joker v1.0'")
+
+    first = tool_registry.check_tools()
+    _new_process()
+    second = tool_registry.check_tools()
+
+    assert first["joker"]["version"] == second["joker"]["version"] == "joker v1.0"
+    assert log.read_text().splitlines() == ["joker"]
+
+
+def test_refresh_ignores_cached_probes(tool_bin, tmp_path):
+    log = tmp_path / "calls.log"
+    tool_bin("joker", f"echo joker >> '{log}'\necho 'joker v1.0'")
+
+    tool_registry.check_tools()
+    tool_registry.check_tools(refresh=True)
+
+    assert log.read_text().splitlines() == ["joker", "joker"]
+
+
+def test_get_tool_version_probes_only_that_tool(tool_bin, tmp_path, cache_dir):
+    log = tmp_path / "calls.log"
+    tool_bin("joker", f"echo joker >> '{log}'\necho 'joker v1.0'")
+    tool_bin("clj-kondo", f"echo clj-kondo >> '{log}'\necho 'clj-kondo v2024.01.01'")
+
+    assert tool_registry.get_tool_version("joker") == "joker v1.0"
+    assert log.read_text().splitlines() == ["joker"]
+    assert _cached_probes(cache_dir) == {"joker": [True, "joker v1.0"]}
+
+    # A full check reuses the cached probe and fills in the rest
+    _new_process()
+    status = tool_registry.check_tools()
+
+    assert status["clj-kondo"]["version"] == "clj-kondo v2024.01.01"
+    assert sorted(log.read_text().splitlines()) == ["clj-kondo", "joker"]
+
+
+def test_get_tool_version_unknown_or_missing_tool(tool_bin):
+    assert tool_registry.get_tool_version("not-a-tool") is None
+    assert tool_registry.get_tool_version("joker") is None
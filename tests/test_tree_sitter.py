@@ -0,0 +1,258 @@
+#
+# Lisp Validator - Multi-dialect Lisp code validation tool
+# Copyright (C) 2025  Tom Waddington
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Tests for the Python tree-sitter path: walking trees and binding APIs."""
+
+import json
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+import legacy_parsers
+import validate_tree_sitter
+
+SOURCE = b"(defn f [x]\n  (let [y (+ x\n  (g ))\n(h 1 2 3 4 5 6 7 8 9 10 11 12 13 14 15 16 17 18 19 20 21 22 23 24 25\n"
+
+
+class FakeNode:
+    """The parts of tree_sitter.Node the walkers read, with has_error derived as tree-sitter does."""
+
+    def __init__(self, type, start, end, children=(), missing=False):
+        self.type = type
+        self.start_byte, self.end_byte = start, end
+        self.start_point = self._point(start)
+        self.end_point = self._point(end)
+        self.is_missing = missing
+        self.children = list(children)
+        self.parent = None
+        self.index = 0
+        for index, child in enumerate(self.children):
+            child.parent, child.index = self, index
+        self.has_error = type == "ERROR" or missing or any(child.has_error for child in self.children)
+        self.visits = 0
+
+    @staticmethod
+    def _point(offset):
+        row = SOURCE.count(b"\n", 0, offset)
+        return row, offset - (SOURCE.rfind(b"\n", 0, offset) + 1)
+
+    def walk(self):
+        return FakeCursor(self)
+
+
+class FakeCursor:
+    """A TreeCursor rooted at one node: it cannot leave that node's subtree."""
+
+    def __init__(self, root):
+        self._root = root
+        self._node = root
+        root.visits += 1
+
+    @property
+    def node(self):
+        return self._node
+
+    def _move(self, node):
+        self._node = node
+        node.visits += 1
+        return True
+
+    def goto_first_child(self):
+        return bool(self._node.children) and self._move(self._node.children[0])
+
+    def goto_next_sibling(self):
+        if self._node is self._root:
+            return False
+        siblings = self._node.parent.children
+        return self._node.index + 1 < len(siblings) and self._move(siblings[self._node.index + 1])
+
+    def goto_parent(self):
+        if self._node is self._root:
+            return False
+        return self._move(self._node.parent)
+
+
+def leaf(type, start, end, missing=False):
+    return FakeNode(type, start, end, missing=missing)
+
+
+def sample_tree():
+    """ERROR and MISSING nodes nested in each other and in sibling subtrees."""
+    clean = FakeNode("list_lit", 0, 11, [leaf("sym_lit", 1, 5), leaf("vec_lit", 8, 11)])
+    nested = FakeNode("list_lit", 14, 33, [
+        leaf("sym_lit", 15, 18),
+        FakeNode("ERROR", 19, 33, [
+            leaf("num_lit", 20, 21),
+            FakeNode("list_lit", 22, 29, [
+                leaf("sym_lit", 23, 24),
+                leaf(")", 29, 29, missing=True),
+            ]),
+            FakeNode("ERROR", 30, 33, [leaf("sym_lit", 31, 32)]),
+        ]),
+        leaf("]", 33, 33, missing=True),
+    ])
+    sibling = FakeNode("list_lit", 34, len(SOURCE) - 1, [
+        leaf("sym_lit", 35, 36),
+        FakeNode("ERROR", 37, len(SOURCE) - 1, [leaf("num_lit", 37, 38)]),
+    ])
+    trailing_clean = FakeNode("list_lit", 34, 36, [leaf("sym_lit", 35, 36)])
+    return FakeNode("source", 0, len(SOURCE), [clean, nested, sibling, trailing_clean, leaf(")", 86, 86, missing=True)])
+
+
+def test_cursor_walk_matches_recursive_walk():
+    tree = sample_tree()
+
+    expected = legacy_parsers.extract_errors_from_tree(tree, "x.clj", SOURCE)
+    findings = validate_tree_sitter.extract_errors_from_tree(tree, "x.clj", SOURCE)
+
+    assert [finding["severity"] for finding in expected] == \
+        ["error", "warning", "error", "warning", "error", "warning"]
+    assert [finding.to_dict() for finding in findings] == expected
+
+
+def test_cursor_walk_skips_error_free_subtrees():
+    tree = sample_tree()
+    clean, trailing_clean = tree.children[0], tree.children[3]
+
+    validate_tree_sitter.extract_errors_from_tree(tree, "x.clj", SOURCE)
+
+    # The cursor lands on a clean subtree's root but never goes below it
+    assert clean.visits == 1
+    assert all(child.visits == 0 for child in clean.children + trailing_clean.children)
+
+
+def test_cursor_walk_on_error_free_tree_returns_nothing():
+    tree = sample_tree().children[0]
+    assert validate_tree_sitter.extract_errors_from_tree(tree, "x.clj", SOURCE) == []
+    assert tree.visits == 0
+
+
+def test_cursor_walk_of_a_subtree_stays_inside_it():
+    nested = sample_tree().children[1]
+    expected = legacy_parsers.extract_errors_from_tree(nested, "x.clj", SOURCE)
+    findings = validate_tree_sitter.extract_errors_from_tree(nested, "x.clj", SOURCE)
+    assert [finding.to_dict() for finding in findings] == expected
+
+
+def test_cursor_walk_handles_nesting_deeper_than_the_recursion_limit():
+    node = leaf(")", 1, 1, missing=True)
+    for _ in range(sys.getrecursionlimit() + 100):
+        node = FakeNode("list_lit", 0, 2, [node])
+
+    findings = validate_tree_sitter.extract_errors_from_tree(node, "x.clj", SOURCE)
+
+    assert [finding.message for finding in findings] == ["Missing expected node: )"]
+
+
+# Fake py-tree-sitter releases, as tree_sitter/__init__.py bodies
+FAKE_TREE = """
+class _Node:
+    has_error = False
+
+
+class _Tree:
+    root_node = _Node()
+"""
+
+FAKE_BINDINGS = {
+    # 0.22+: no set_language, the language is a property
+    "language_property": FAKE_TREE + """
+class Parser:
+    language = None
+
+    def parse(self, source):
+        return _Tree()
+""",
+    # No set_language and no settable language either
+    "no_setter": FAKE_TREE + """
+class Parser:
+    @property
+    def language(self):
+        return None
+
+    def parse(self, source):
+        return _Tree()
+""",
+    # A grammar built for a different tree-sitter ABI
+    "incompatible_grammar": FAKE_TREE + """
+class Parser:
+    def set_language(self, language):
+        raise ValueError("Incompatible Language version 15. Must be between 13 and 14")
+""",
+    # Parsing itself fails
+    "parse_fails": FAKE_TREE + """
+class Parser:
+    def set_language(self, language):
+        pass
+
+    def parse(self, source):
+        raise TypeError("source must be a bytestring")
+""",
+}
+
+
+@pytest.fixture
+def fake_binding(tmp_path, monkeypatch):
+    """Install a fake tree_sitter package (plus tree_sitter_elisp) on sys.path."""
+    def install(name):
+        site = tmp_path / "site"
+        for package, body in (("tree_sitter", FAKE_BINDINGS[name]),
+                              ("tree_sitter_elisp", "def language():\n    return object()\n")):
+            (site / package).mkdir(parents=True, exist_ok=True)
+            (site / package / "__init__.py").write_text(textwrap.dedent(body))
+            monkeypatch.delitem(sys.modules, package, raising=False)
+        monkeypatch.syspath_prepend(str(site))
+        monkeypatch.setattr(validate_tree_sitter, "_TS_LANGS", {})
+        monkeypatch.setattr(validate_tree_sitter, "_PARSERS", {})
+        return site
+
+    return install
+
+
+@pytest.fixture
+def elisp_file(tmp_path):
+    path = tmp_path / "init.el"
+    path.write_text("(setq x 1)\n")
+    return str(path)
+
+
+def test_language_property_binding_is_used(fake_binding, elisp_file):
+    fake_binding("language_property")
+    assert validate_tree_sitter.validate_with_python_library(elisp_file) == (True, [])
+
+
+@pytest.mark.parametrize("name", ["no_setter", "incompatible_grammar", "parse_fails"])
+def test_unusable_binding_falls_back_to_the_cli(fake_binding, elisp_file, name):
+    fake_binding(name)
+    assert validate_tree_sitter.validate_with_python_library(elisp_file) == (False, [])
+
+
+@pytest.mark.parametrize("name", ["no_setter", "incompatible_grammar", "parse_fails"])
+def test_validate_py_reports_json_with_an_unusable_binding(fake_binding, elisp_file, tool_bin, name):
+    site = fake_binding(name)
+    script = Path(__file__).resolve().parent.parent / "scripts" / "validate.py"
+
+    run = subprocess.run([sys.executable, str(script), elisp_file], capture_output=True, text=True,
+                         timeout=60, env={**os.environ, "PYTHONPATH": str(site)})
+
+    assert "Traceback" not in run.stderr
+    result = json.loads(run.stdout)
+    assert result["warnings"] == ["tree-sitter not available (neither CLI nor Python library)"]